@@ -36,10 +36,25 @@ class BaseConfig(BaseSettings):
     MYSQL_PASSWORD: str
     MYSQL_DB_NAME: str
     MYSQL_TEST_DB_NAME: str = "journey_lingua_test"
+    # Read replica, routing is disabled when the host is empty
+    MYSQL_REPLICA_HOST: str = ""
+    MYSQL_REPLICA_PORT: str = "3306"
 
     # SQLALCHEMY
     SQL_ALCHEMY_DATABASE_URI: str = ""
     ASYNC_SQL_ALCHEMY_URI: str = ""
+    SQL_ECHO: bool = False
+    SQL_POOL_SIZE: int = 10
+    SQL_MAX_OVERFLOW: int = 20
+    SQL_POOL_TIMEOUT_SECONDS: int = 10
+    # Recycle connections before MySQL wait_timeout drops them
+    SQL_POOL_RECYCLE_SECONDS: int = 1800
+    SQL_POOL_PRE_PING: bool = True
+    # Statements slower than this are logged, 0 disables the log
+    SQL_SLOW_QUERY_MS: int = 200
+    # Reads fall back to the primary beyond this replication lag
+    SQL_REPLICA_MAX_LAG_SECONDS: int = 5
+    SQL_REPLICA_CHECK_INTERVAL_SECONDS: int = 10
 
     # REDIS
     REDIS_ON: bool
@@ -48,6 +63,14 @@ class BaseConfig(BaseSettings):
     REDIS_DB: int
     REDIS_PASSWORD: str
     REDIS_NODES: List[dict] = []
+    REDIS_MAX_CONNECTIONS: int = 50
+    # Seconds to wait for a free pooled connection before failing
+    REDIS_POOL_TIMEOUT_SECONDS: float = 2.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 1.0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 1.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    REDIS_RETRIES: int = 2
+    USER_CACHE_TTL_SECONDS: int = 300
 
     # CLIENT_ID
     CLIENT_ID: str
@@ -71,6 +94,17 @@ class BaseConfig(BaseSettings):
     JWT_AUD_RESET: str = "journey_lingua:reset"
     JWT_TOKEN_SECRET: str
     JWT_TOKEN_EXPIRATION_DAY: int = 180
+    JWT_CLAIMS_CACHE_SIZE: int = 10000
+
+    # PASSWORD
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    # The first available scheme hashes new passwords, argon2 needs argon2-cffi
+    PASSWORD_HASH_SCHEMES: List[str] = ["bcrypt"]
+    # Target hashing latency for the cost autotuning, 0 disables it
+    PASSWORD_HASH_TARGET_MS: int = 250
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_MEMORY_KIB: int = 65536
 
     # SMS
     MEDIA_SMS_ENDPOINT: str = "https://www.sms-ope.com/sms/api/"
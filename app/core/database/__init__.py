@@ -1,16 +1,14 @@
 from asyncio import current_task
 from typing import AsyncGenerator, TypeVar
 
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_scoped_session,
-    create_async_engine,
-)
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.decl_api import DeclarativeMeta
 
 from app.config.config import Config
+from app.core.database.engine import create_engine
+from app.core.database.routing import ReplicaMonitor, RoutingSession
 
 MYSQL_URL = (
     f"mysql+aiomysql://{Config.MYSQL_USER}:{Config.MYSQL_PASSWORD}"
@@ -18,7 +16,24 @@ MYSQL_URL = (
     f"/{Config.MYSQL_DB_NAME}?charset=utf8mb4"
 )
 
-async_engine = create_async_engine(MYSQL_URL, echo=True)
+async_engine = create_engine(MYSQL_URL)
+
+# Reads marked with execution_options(read_replica=True) are routed to the
+# replica when one is configured.
+replica_engine = None
+replica_monitor = None
+if Config.MYSQL_REPLICA_HOST:
+    replica_engine = create_engine(
+        f"mysql+aiomysql://{Config.MYSQL_USER}:{Config.MYSQL_PASSWORD}"
+        f"@{Config.MYSQL_REPLICA_HOST}:{Config.MYSQL_REPLICA_PORT}"
+        f"/{Config.MYSQL_DB_NAME}?charset=utf8mb4"
+    )
+    replica_monitor = ReplicaMonitor(
+        replica_engine,
+        max_lag_seconds=Config.SQL_REPLICA_MAX_LAG_SECONDS,
+        interval_seconds=Config.SQL_REPLICA_CHECK_INTERVAL_SECONDS,
+    )
+
 AsyncSessionLocal = async_scoped_session(
     sessionmaker(
         autocommit=False,
@@ -26,6 +41,9 @@ AsyncSessionLocal = async_scoped_session(
         bind=async_engine,
         future=True,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replica_bind=replica_engine.sync_engine if replica_engine else None,
+        replica_monitor=replica_monitor,
     ),
     scopefunc=current_task,
 )
@@ -38,8 +56,10 @@ BaseT = TypeVar("BaseT", bound=DeclarativeMeta)
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     @brief Get a database.
+    The session is owned by the request, it is not registered in the task
+    scoped AsyncSessionLocal registry.
     """
-    async with AsyncSessionLocal() as session:
+    async with AsyncSessionLocal.session_factory() as session:
         try:
             yield session
         finally:
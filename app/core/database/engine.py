@@ -0,0 +1,107 @@
+import time
+from typing import Any, Dict
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config.config import Config
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that counts checkouts and the time spent waiting for one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            logger.warning(f"Database pool exhausted: {self.stats()}")
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.checkouts += 1
+        return connection
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_seconds": self.total_wait_seconds / self.checkouts
+            if self.checkouts
+            else 0.0,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    # The execution context lives for exactly one statement.
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    started = getattr(context, "_query_started_at", None)
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if elapsed_ms >= Config.SQL_SLOW_QUERY_MS:
+        logger.warning(
+            f"Slow query ({elapsed_ms:.1f} ms): {statement} "
+            f"parameters={parameters!r}"
+        )
+
+
+def create_engine(url: str, **options: Any) -> AsyncEngine:
+    """
+    Create an async engine with the pool settings of ``Config``.
+    Any keyword argument overrides the configured value.
+    """
+    settings: Dict[str, Any] = {
+        "echo": Config.SQL_ECHO,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": Config.SQL_POOL_SIZE,
+        "max_overflow": Config.SQL_MAX_OVERFLOW,
+        "pool_timeout": Config.SQL_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": Config.SQL_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": Config.SQL_POOL_PRE_PING,
+    }
+    settings.update(options)
+    engine = create_async_engine(url, **settings)
+    # A threshold of 0 or less disables the slow query log.
+    if Config.SQL_SLOW_QUERY_MS > 0:
+        event.listen(
+            engine.sync_engine, "before_cursor_execute", _before_cursor_execute
+        )
+        event.listen(
+            engine.sync_engine, "after_cursor_execute", _after_cursor_execute
+        )
+    return engine
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Mapping, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class ReplicaMonitor:
+    """
+    Polls the replica in the background and reports it healthy while its
+    replication lag stays under ``max_lag_seconds``.
+    """
+
+    REPLICA_STATUS = "SHOW REPLICA STATUS"
+    # The only form known before MySQL 8.0.22 and MariaDB 10.5.1.
+    SLAVE_STATUS = "SHOW SLAVE STATUS"
+    # MySQL renamed the column along with the statement, MariaDB did not.
+    LAG_COLUMNS = ("Seconds_Behind_Source", "Seconds_Behind_Master")
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        max_lag_seconds: int,
+        interval_seconds: int,
+    ) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.interval_seconds = interval_seconds
+        # Unknown until the first check succeeds, reads use the primary.
+        self.healthy = False
+        self.lag_seconds: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._status_query: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def check(self) -> bool:
+        try:
+            status = await self._read_status()
+        except Exception as e:
+            self._set_health(False, None, f"replica unreachable: {e}")
+            return self.healthy
+
+        lag = self._lag_seconds(status)
+        # NULL lag means the replication threads are not running.
+        if lag is None:
+            self._set_health(False, None, "replica is not replicating")
+        elif lag > self.max_lag_seconds:
+            self._set_health(False, lag, f"replica lagging {lag}s")
+        else:
+            self._set_health(True, lag, "replica healthy")
+        return self.healthy
+
+    async def _read_status(self) -> Optional[Mapping[str, Any]]:
+        # The statement the server understands is found on the first check.
+        if self._status_query is None:
+            try:
+                status = await self._fetch_status(self.REPLICA_STATUS)
+            except ProgrammingError:
+                self._status_query = self.SLAVE_STATUS
+            else:
+                self._status_query = self.REPLICA_STATUS
+                return status
+        return await self._fetch_status(self._status_query)
+
+    async def _fetch_status(self, query: str) -> Optional[Mapping[str, Any]]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(text(query))
+            return result.mappings().first()
+
+    def _lag_seconds(
+        self, status: Optional[Mapping[str, Any]]
+    ) -> Optional[int]:
+        if not status:
+            return None
+        for column in self.LAG_COLUMNS:
+            if column in status:
+                return status[column]
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
+
+    def _set_health(
+        self, healthy: bool, lag_seconds: Optional[int], reason: str
+    ) -> None:
+        # Only log transitions to keep the log quiet.
+        if healthy != self.healthy:
+            log = logger.info if healthy else logger.warning
+            log(f"Read replica routing {'on' if healthy else 'off'}: {reason}")
+        self.healthy = healthy
+        self.lag_seconds = lag_seconds
+
+
+class RoutingSession(Session):
+    """
+    Session that sends statements marked with the ``read_replica``
+    execution option to the replica.
+
+    Once the session has written anything, every later statement stays on
+    the primary so that a request always reads its own writes. Reads also
+    stay on the primary while the replica monitor reports it unhealthy.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_bind: Optional[Engine] = None,
+        replica_monitor: Optional[ReplicaMonitor] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.replica_monitor = replica_monitor
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["has_written"] = True
+            return primary
+        if (
+            self.replica_bind is None
+            or self.info.get("has_written")
+            or not isinstance(clause, Executable)
+            or not clause.get_execution_options().get("read_replica")
+        ):
+            return primary
+        monitor = self.replica_monitor
+        if monitor is not None and not monitor.healthy:
+            return primary
+        return self.replica_bind
@@ -0,0 +1,19 @@
+import dataclasses
+from typing import Any
+
+from app.core.entities.user.user_auth_projection import UserAuthProjection
+
+
+@dataclasses.dataclass(frozen=True)
+class AuthContextEntity:
+    token: str
+    claims: dict[str, Any]
+    user: UserAuthProjection
+
+    @property
+    def user_id(self) -> int:
+        return self.user.id
+
+    @property
+    def is_email_login(self) -> bool:
+        return bool(self.claims.get("email"))
@@ -0,0 +1,19 @@
+from typing import NamedTuple, Optional, TypeVar
+
+ProjectionT = TypeVar("ProjectionT", bound=tuple)
+
+
+class UserAuthProjection(NamedTuple):
+    """
+    The user columns needed to authenticate a request, and the contact
+    columns the verify refresh routes send to.
+    Timestamps are kept as the stored epoch seconds.
+    """
+
+    id: int
+    email: Optional[str]
+    phone: Optional[str]
+    deleted_at: Optional[int]
+    is_active: bool
+    is_email_verified: bool
+    is_phone_verified: bool
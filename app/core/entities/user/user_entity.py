@@ -1,7 +1,7 @@
 import dataclasses
 import datetime
-import random
 import re
+import secrets
 import string
 
 import app.core.exceptions.user.user_exceptions as exception
@@ -10,6 +10,7 @@ import app.core.exceptions.user.user_exceptions as exception
 @dataclasses.dataclass
 class UserEntity:
     USER_CODE_LENGTH = 13
+    USER_CODE_ALPHABET = string.ascii_letters + string.digits
 
     hashed_password: str
     sex_code: str
@@ -52,16 +53,10 @@ class UserEntity:
         return True
 
     def generate_user_code_if_empty(self):
+        # The code no longer embeds the id, so it can be set before insert.
         if self.user_code:
             return
-        if not self.id:
-            raise ValueError("id is required to generate user_code")
-
-        id_str = str(self.id)
-        padding_length = self.USER_CODE_LENGTH - 1 - len(id_str)
-        padding = "".join(
-            random.choices(
-                string.ascii_letters + string.digits, k=padding_length
-            )
+        self.user_code = "".join(
+            secrets.choice(self.USER_CODE_ALPHABET)
+            for _ in range(self.USER_CODE_LENGTH)
         )
-        self.user_code = f"{padding}_{id_str}"
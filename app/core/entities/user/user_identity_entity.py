@@ -0,0 +1,12 @@
+import dataclasses
+
+
+@dataclasses.dataclass
+class UserIdentityEntity:
+    provider: str
+    provider_uid: str
+    user_id: int | None = None
+    id: int | None = None
+
+    PROVIDER_FACEBOOK = "facebook"
+    PROVIDER_GOOGLE = "google"
@@ -1,11 +1,117 @@
+import time
+from typing import Any, Dict, Optional, Set
+
 import redis.asyncio
+import redis.exceptions
+from loguru import logger
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 
 from app.config.config import Config
 
-redis_connection = redis.asyncio.from_url(
-    f"redis://{Config.REDIS_HOST}:{Config.REDIS_PORT}",
-    decode_responses=True,
-)
+
+class InstrumentedConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """
+    Bounded connection pool that keeps counters about its usage.
+
+    Callers wait up to ``timeout`` seconds for a free connection instead of
+    opening new ones without limit, and the wait time is recorded.
+    """
+
+    # Message of the ConnectionError raised when the wait timed out.
+    POOL_EXHAUSTED_MESSAGE = "No connection available."
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.created = 0
+        self._in_use: Set[int] = set()
+        self.acquired = 0
+        self.timeouts = 0
+        self.connection_errors = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def make_connection(self):
+        self.created += 1
+        return super().make_connection()
+
+    async def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(
+                command_name, *keys, **options
+            )
+        except redis.exceptions.ConnectionError as e:
+            # The same error is raised when connecting to Redis failed.
+            if str(e) != self.POOL_EXHAUSTED_MESSAGE:
+                self.connection_errors += 1
+                raise
+            self.timeouts += 1
+            logger.warning(f"Redis pool exhausted: {self.stats()}")
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.acquired += 1
+        self._in_use.add(id(connection))
+        return connection
+
+    async def release(self, connection) -> None:
+        # Also called by the base pool for connections that failed to
+        # connect, which were never handed out.
+        self._in_use.discard(id(connection))
+        await super().release(connection)
+
+    @property
+    def in_use(self) -> int:
+        return len(self._in_use)
+
+    def stats(self) -> Dict[str, Any]:
+        open_connections = len(self._connections)
+        return {
+            "max_connections": self.max_connections,
+            "created": self.created,
+            "open": open_connections,
+            "in_use": self.in_use,
+            "idle": max(open_connections - self.in_use, 0),
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "connection_errors": self.connection_errors,
+            "avg_wait_seconds": self.total_wait_seconds / self.acquired
+            if self.acquired
+            else 0.0,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+def create_redis(node: Optional[dict] = None) -> redis.asyncio.Redis:
+    """
+    Build a Redis client for a node of ``Config.REDIS_NODES``.
+    No connection is opened until the first command.
+    """
+    node = node or Config.REDIS_NODES[0]
+    pool = InstrumentedConnectionPool(
+        host=node["host"],
+        port=node["port"],
+        db=node["db"],
+        password=node["password"] or None,
+        max_connections=Config.REDIS_MAX_CONNECTIONS,
+        timeout=Config.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=Config.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=Config.REDIS_CONNECT_TIMEOUT_SECONDS,
+        health_check_interval=Config.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        retry=Retry(ExponentialBackoff(), Config.REDIS_RETRIES),
+        retry_on_error=[
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+        ],
+        decode_responses=True,
+    )
+    return redis.asyncio.Redis(connection_pool=pool)
+
+
+redis_connection = create_redis()
 
 
 def get_redis():
@@ -15,3 +121,7 @@ def get_redis():
     Connection ` or : data : ` None ` if there is no
     """
     return redis_connection
+
+
+def redis_pool_stats() -> Dict[str, Any]:
+    return redis_connection.connection_pool.stats()
@@ -1,5 +1,8 @@
+from typing import Optional, Tuple
+
 import redis.asyncio
 import redis.exceptions
+from redis.commands.core import AsyncScript
 
 from app.core.entities.user.user_entity import UserEntity
 from app.repositories.user.refresh_count_repository import (
@@ -7,6 +10,16 @@ from app.repositories.user.refresh_count_repository import (
 )
 
 
+# Every refresh pushes the expiry out again, so the count only resets
+# after a full window without refreshes.
+# KEYS[1] is the counter, ARGV[1] the window in seconds.
+INCREMENT_COUNT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return count
+"""
+
+
 class RefreshCountRepository(RefreshCountRepositoryProtocol):
     def __init__(
         self,
@@ -17,17 +30,28 @@ class RefreshCountRepository(RefreshCountRepositoryProtocol):
         self.redis = redis
         self.token_prefix = token_prefix
         self.lifetime_seconds = lifetime_seconds
+        self._increment_script: Optional[AsyncScript] = None
 
-    async def write_count(self, user_entity: UserEntity, count: int) -> None:
+    async def increment_count(
+        self, user_entity: UserEntity, limit: int
+    ) -> Tuple[int, bool]:
         """
-        Save the refresh count in Redis for a 24-hour period.
+        Atomically count a refresh, the count lives for 24 hours after
+        the latest one. Returns the new count and whether it went over
+        the limit.
         """
-        count_key = f"{self.token_prefix}{str(user_entity.id)}"
-        await self.redis.set(
-            count_key,
-            str(count),
-            ex=self.lifetime_seconds,
+        # register_script caches the SHA and falls back to EVAL once.
+        if self._increment_script is None:
+            self._increment_script = self.redis.register_script(
+                INCREMENT_COUNT_SCRIPT
+            )
+        count = int(
+            await self._increment_script(
+                keys=[f"{self.token_prefix}{user_entity.id}"],
+                args=[self.lifetime_seconds],
+            )
         )
+        return count, count > limit
 
     async def read_count(self, user_entity: UserEntity) -> int:
         count = await self.redis.get(f"{self.token_prefix}{user_entity.id}")
@@ -41,7 +65,4 @@ class RefreshCountRepository(RefreshCountRepositoryProtocol):
         """
         @brief Destroy the count of a user.
         """
-        count = await self.read_count(user_entity)
-        # Delete the user entity from redis.
-        if count > 0:
-            await self.redis.delete(f"{self.token_prefix}{user_entity.id}")
+        await self.redis.delete(f"{self.token_prefix}{user_entity.id}")
@@ -0,0 +1,243 @@
+import asyncio
+import dataclasses
+import datetime
+import secrets
+from typing import Any, Iterable, Optional, Type
+
+import orjson
+import redis.asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.config import Config
+from app.core.entities.user.user_auth_projection import ProjectionT
+from app.core.entities.user.user_entity import UserEntity
+from app.repositories.user.user_repository_protocol import (
+    UserRepositoryProtocol,
+)
+
+
+class CachedUserRepository(UserRepositoryProtocol):
+    """
+    Read-through Redis cache in front of a UserRepositoryProtocol.
+
+    find_by_id is served from Redis. A cache miss is loaded by a single
+    caller holding a short-lived lock; the others wait for the cache to
+    fill. create/update drop the cached record, and the cache is filled
+    from the primary so a lagging replica cannot put it back stale.
+
+    Password hashes and social access tokens are never written to Redis,
+    cached users carry None for them. Flows that check a password read
+    the user from MySQL through find_by_email/find_by_phone. Cached users
+    are marked, and update refuses to write a secret field they did not
+    get a new value for.
+    """
+
+    SECRET_FIELDS = (
+        "hashed_password",
+        "facebook_access_token",
+        "google_access_token",
+    )
+    # Attribute set on users read from Redis, not a dataclass field.
+    REDACTED_ATTR = "_redacted_fields"
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryProtocol,
+        redis: redis.asyncio.Redis,
+        key_prefix="user:",
+        lifetime_seconds=Config.USER_CACHE_TTL_SECONDS,
+        lock_seconds=5,
+        lock_wait_seconds=0.05,
+        lock_retries=20,
+    ):
+        self.user_repository = user_repository
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self.lifetime_seconds = lifetime_seconds
+        self.lock_seconds = lock_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+        self.lock_retries = lock_retries
+
+    async def find_by_id(
+        self, session: AsyncSession, id: int, read_replica: bool = True
+    ) -> Optional[UserEntity]:
+        if not read_replica:
+            return await self.user_repository.find_by_id(
+                session, id, read_replica=False
+            )
+        key = self._key(id)
+        user = await self._read(key)
+        if user:
+            return user
+
+        lock_key = f"{key}:lock"
+        lock_token = secrets.token_hex(8)
+        for _ in range(self.lock_retries):
+            # Returns True if set, or None if another caller holds the lock
+            locked = await self.redis.set(
+                lock_key, lock_token, ex=self.lock_seconds, nx=True
+            )
+            if locked:
+                try:
+                    return await self._load(session, id, key)
+                finally:
+                    await self._release(lock_key, lock_token)
+            await asyncio.sleep(self.lock_wait_seconds)
+            user = await self._read(key)
+            if user:
+                return user
+
+        # The lock holder is too slow, fall back to the database.
+        return await self.user_repository.find_by_id(session, id)
+
+    async def find_projection_by_id(
+        self, session: AsyncSession, id: int, projection: Type[ProjectionT]
+    ) -> Optional[ProjectionT]:
+        # Project a cached user, a miss only reads the projected columns
+        # and leaves the cache of full users alone.
+        user = await self._read(self._key(id))
+        if user is None:
+            return await self.user_repository.find_projection_by_id(
+                session, id, projection
+            )
+        return projection._make(
+            self._column_value(getattr(user, name))
+            for name in projection._fields
+        )
+
+    async def find_by_email(
+        self, session: AsyncSession, email: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_email(session, email)
+
+    async def find_by_phone(
+        self, session: AsyncSession, phone: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_phone(session, phone)
+
+    async def find_by_facebook_id(
+        self, session: AsyncSession, facebook_id: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_facebook_id(
+            session, facebook_id
+        )
+
+    async def find_by_google_id(
+        self, session: AsyncSession, google_id: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_google_id(
+            session, google_id
+        )
+
+    async def find_by_social_id(
+        self, session: AsyncSession, provider: str, provider_uid: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_social_id(
+            session, provider, provider_uid
+        )
+
+    async def find_by_user_code(
+        self, session: AsyncSession, user_code: str
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_by_user_code(
+            session, user_code
+        )
+
+    async def find_tombstone(
+        self, session: AsyncSession, key: str, value: Any
+    ) -> Optional[UserEntity]:
+        return await self.user_repository.find_tombstone(session, key, value)
+
+    async def create(
+        self, session: AsyncSession, user: UserEntity
+    ) -> UserEntity:
+        user = await self.user_repository.create(session, user)
+        await self.invalidate(user.id)
+        return user
+
+    async def update(
+        self,
+        session: AsyncSession,
+        user: UserEntity,
+        fields: Iterable[str],
+    ) -> UserEntity:
+        fields = list(fields)
+        self._check_writable(user, fields)
+        user = await self.user_repository.update(session, user, fields)
+        # The inner update has committed, drop the stale cached user.
+        await self.invalidate(user.id)
+        return user
+
+    async def invalidate(self, id: Optional[int]) -> None:
+        if id is None:
+            return
+        await self.redis.delete(self._key(id))
+
+    async def _load(
+        self, session: AsyncSession, id: int, key: str
+    ) -> Optional[UserEntity]:
+        # Another caller may have filled the cache while we waited.
+        user = await self._read(key)
+        if user:
+            return user
+        user = await self.user_repository.find_by_id(
+            session, id, read_replica=False
+        )
+        if user:
+            await self.redis.set(
+                key, self._serialize(user), ex=self.lifetime_seconds
+            )
+        return user
+
+    async def _release(self, lock_key: str, lock_token: str) -> None:
+        # Only release the lock if it has not expired and been re-acquired.
+        if await self.redis.get(lock_key) == lock_token:
+            await self.redis.delete(lock_key)
+
+    async def _read(self, key: str) -> Optional[UserEntity]:
+        cached = await self.redis.get(key)
+        if cached is None:
+            return None
+        return self._deserialize(cached)
+
+    @classmethod
+    def _check_writable(
+        cls, user: UserEntity, fields: Iterable[str]
+    ) -> None:
+        redacted = getattr(user, cls.REDACTED_ATTR, ())
+        for name in fields:
+            if name in redacted and getattr(user, name) is None:
+                raise ValueError(f"{name} is not loaded in a cached user")
+
+    @staticmethod
+    def _column_value(value):
+        # Timestamps are stored as epoch seconds.
+        if isinstance(value, datetime.datetime):
+            return int(value.timestamp())
+        return value
+
+    def _key(self, id: int) -> str:
+        return f"{self.key_prefix}{id}"
+
+    @classmethod
+    def _serialize(cls, user: UserEntity) -> str:
+        values = dataclasses.asdict(user)
+        for name in cls.SECRET_FIELDS:
+            del values[name]
+        return orjson.dumps(values).decode()
+
+    @classmethod
+    def _deserialize(cls, data: str) -> UserEntity:
+        values = orjson.loads(data)
+        for name in cls.SECRET_FIELDS:
+            values[name] = None
+        if values.get("birthday"):
+            values["birthday"] = datetime.date.fromisoformat(
+                values["birthday"]
+            )
+        for name in ("created_at", "updated_at", "deleted_at"):
+            if values.get(name):
+                values[name] = datetime.datetime.fromisoformat(values[name])
+        user = UserEntity(**values)
+        setattr(user, cls.REDACTED_ATTR, cls.SECRET_FIELDS)
+        return user
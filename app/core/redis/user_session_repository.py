@@ -1,6 +1,10 @@
-from typing import Optional
+import hashlib
+import secrets
+import time
+from typing import Any, Dict, List, Optional
 
 import redis.asyncio
+from redis.commands.core import AsyncScript
 
 from app.config.config import Config
 from app.core.entities.user.user_entity import UserEntity
@@ -11,15 +15,80 @@ from app.repositories.session.user_session_repository_protocol import (
 )
 
 
+# Every key a script touches is passed in KEYS, the sessions of the sids
+# read from the index beforehand included. The keys still span several
+# hash slots, so the scripts need the single node client of create_redis.
+
+# Drops the given sessions and their sids from the user index, and the
+# index once it is empty. Sessions stored since the index was read stay.
+# KEYS[1] is the index, KEYS[2..] the sessions and ARGV their sids.
+DESTROY_ALL_SESSIONS_SCRIPT = """
+for i = 2, #KEYS do
+    redis.call('DEL', KEYS[i])
+end
+for _, session_id in ipairs(ARGV) do
+    redis.call('SREM', KEYS[1], session_id)
+end
+if redis.call('SCARD', KEYS[1]) == 0 then
+    redis.call('DEL', KEYS[1])
+end
+return #ARGV
+"""
+
+# Stores a session and adds its sid to the user index. Listed sids whose
+# session already expired are pruned so the index does not grow, and the
+# index TTL is only ever extended. KEYS[1] is the session, KEYS[2] the
+# index and KEYS[3..] the sessions of the listed sids. ARGV[1] is the
+# user id, ARGV[2] the lifetime in seconds, ARGV[3] the sid and ARGV[4..]
+# the listed sids, in the order of their KEYS.
+STORE_SESSION_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+local pruned = 0
+for i = 3, #KEYS do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        pruned = pruned + redis.call('SREM', KEYS[2], ARGV[i + 1])
+    end
+end
+redis.call('SADD', KEYS[2], ARGV[3])
+if redis.call('TTL', KEYS[2]) < tonumber(ARGV[2]) then
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return pruned
+"""
+
+
 class UserSessionRepository(UserSessionRepositoryProtocol):
+    """
+    Sessions are stored as ``user_session:<sid>`` -> user_id, where sid is
+    the ``jti`` claim of the access token, and expire together with the
+    token. ``user_sessions:<user_id>`` indexes the sids of a user.
+
+    Callers pass the claims of the token they already decoded.
+    """
+
     def __init__(
-        self, redis: redis.asyncio.Redis, session_token="user_session_token:"
+        self,
+        redis: redis.asyncio.Redis,
+        session_key="user_session:",
+        user_sessions_key="user_sessions:",
+        legacy_session_token="user_session_token:",
     ):
         self.redis = redis
-        self.session_token = session_token
+        self.session_key = session_key
+        self.user_sessions_key = user_sessions_key
+        self.legacy_session_token = legacy_session_token
+        self._destroy_all_script: Optional[AsyncScript] = None
+        self._store_script: Optional[AsyncScript] = None
 
-    async def read_token(self, token: str) -> Optional[int]:
-        user_id = await self.redis.get(f"{self.session_token}{token}")
+    async def read_token(
+        self, token: str, claims: Dict[str, Any]
+    ) -> Optional[int]:
+        user_id = await self.redis.get(self._session_key(claims, token))
+        # Tokens issued before the sid keys were introduced.
+        if user_id is None and not claims.get("jti"):
+            user_id = await self.redis.get(
+                f"{self.legacy_session_token}{token}"
+            )
         # Returns the user_id if user_id is not None.
         if user_id is None:
             return None
@@ -39,7 +108,8 @@ class UserSessionRepository(UserSessionRepositoryProtocol):
         elif login_type is LoginType.GOOGLE:
             data.update({"google_id": user.google_id})
 
-        data.update({"user_id": str(user.id)})
+        session_id = secrets.token_urlsafe(12)
+        data.update({"user_id": str(user.id), "jti": session_id})
         token = jwt.generate_jwt(
             data,
             Config.JWT_TOKEN_SECRET,
@@ -47,8 +117,106 @@ class UserSessionRepository(UserSessionRepositoryProtocol):
             Config.JWT_TOKEN_EXPIRATION_DAY,
             Config.JWT_ALGORITHM,
         )
-        await self.redis.set(f"{self.session_token}{token}", str(user.id))
+        await self.store_session(
+            session_id,
+            user.id,
+            Config.JWT_TOKEN_EXPIRATION_DAY * 24 * 60 * 60,
+        )
         return token
 
-    async def destroy_token(self, token: str) -> None:
-        await self.redis.delete(f"{self.session_token}{token}")
+    async def destroy_token(self, token: str, claims: Dict[str, Any]) -> None:
+        session_id = self._session_id(claims, token)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(f"{self.session_key}{session_id}")
+        if not claims.get("jti"):
+            pipe.delete(f"{self.legacy_session_token}{token}")
+        if claims.get("user_id"):
+            pipe.srem(
+                f"{self.user_sessions_key}{claims['user_id']}", session_id
+            )
+        await pipe.execute()
+
+    async def destroy_all_tokens(self, user_id: int) -> int:
+        """
+        Revoke every session of the user atomically.
+        Returns the number of sessions that were listed in the index.
+        """
+        index_key = f"{self.user_sessions_key}{user_id}"
+        session_ids = sorted(await self.redis.smembers(index_key))
+        if not session_ids:
+            return 0
+        # register_script caches the SHA and falls back to EVAL once.
+        if self._destroy_all_script is None:
+            self._destroy_all_script = self.redis.register_script(
+                DESTROY_ALL_SESSIONS_SCRIPT
+            )
+        return await self._destroy_all_script(
+            keys=[index_key, *self._session_keys(session_ids)],
+            args=session_ids,
+        )
+
+    async def store_session(
+        self, session_id: str, user_id: int, lifetime_seconds: int
+    ) -> int:
+        """
+        Store a session and prune dead sids from the user index.
+        Returns the number of pruned sids.
+        """
+        index_key = f"{self.user_sessions_key}{user_id}"
+        listed = sorted(await self.redis.smembers(index_key))
+        if self._store_script is None:
+            self._store_script = self.redis.register_script(
+                STORE_SESSION_SCRIPT
+            )
+        return await self._store_script(
+            keys=[
+                f"{self.session_key}{session_id}",
+                index_key,
+                *self._session_keys(listed),
+            ],
+            args=[user_id, lifetime_seconds, session_id, *listed],
+        )
+
+    async def migrate_legacy_token(
+        self,
+        token: str,
+        user_id: str,
+        claims: Optional[Dict[str, Any]],
+    ) -> bool:
+        """
+        Move a ``user_session_token:<jwt>`` key to the sid scheme with a
+        TTL matching the token. Expired or invalid tokens, which have no
+        claims, are dropped. Returns True if the session was kept.
+        """
+        legacy_key = f"{self.legacy_session_token}{token}"
+        lifetime = self._lifetime_seconds(claims)
+        if claims is None or lifetime <= 0:
+            await self.redis.delete(legacy_key)
+            return False
+
+        await self.store_session(
+            self._session_id(claims, token), int(user_id), lifetime
+        )
+        await self.redis.delete(legacy_key)
+        return True
+
+    def _session_keys(self, session_ids: List[str]) -> List[str]:
+        return [f"{self.session_key}{sid}" for sid in session_ids]
+
+    def _session_key(self, claims: Dict[str, Any], token: str) -> str:
+        return f"{self.session_key}{self._session_id(claims, token)}"
+
+    @staticmethod
+    def _session_id(claims: Dict[str, Any], token: str) -> str:
+        # Legacy tokens have no jti, they are keyed by a digest instead.
+        if claims.get("jti"):
+            return str(claims["jti"])
+        return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _lifetime_seconds(claims: Optional[Dict[str, Any]]) -> int:
+        if claims is None:
+            return 0
+        if claims.get("exp") is None:
+            return Config.JWT_TOKEN_EXPIRATION_DAY * 24 * 60 * 60
+        return int(claims["exp"] - time.time())
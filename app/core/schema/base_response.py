@@ -1,16 +1,54 @@
 import os
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
-
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import DateTime
 from starlette.background import BackgroundTask
-from starlette.responses import FileResponse
+from starlette.concurrency import iterate_in_threadpool
+from starlette.responses import FileResponse, StreamingResponse
+
+from app.core.schema.error_schema import Error, ErrorCode
+from app.core.schema.json_response import JSONBytesResponse
+from app.helpers.serializer import Serializer
+
+DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+Converter = Callable[[Any], Any]
+
+
+def _nullable(convert: Converter) -> Converter:
+    return lambda value: None if value is None else convert(value)
+
 
-from app.core.schema.error_schema import Error
-from app.helpers.encoder import jsonable_encoder
+format_datetime = _nullable(lambda x: x.strftime(DATETIME_FORMAT))
+
+# Converters of json_serialize, by the type of the values of a column.
+SQL_VALUE_CONVERTERS: List[Tuple[type, Converter]] = [
+    (set, _nullable(list)),
+    (datetime, format_datetime),
+    (Decimal, _nullable(str)),
+    (bytes, _nullable(lambda x: x.decode(encoding="utf-8"))),
+]
 
 
 class BaseResponse(object):
+    # Encoders are cached per type, so the instance is shared.
+    serializer = Serializer(
+        type_encoders={datetime: format_datetime}
+    )
+
     @staticmethod
     def model_to_dict(obj, *ignore: str):
         """
@@ -38,7 +76,7 @@ class BaseResponse(object):
             val = getattr(obj, c.name)
             # Set the data for this column.
             if isinstance(val, datetime):
-                data[c.name] = val.strftime("%d-%m-%Y %H:%M:%S")
+                data[c.name] = val.strftime(DATETIME_FORMAT)
             else:
                 data[c.name] = val
         return data
@@ -83,7 +121,7 @@ class BaseResponse(object):
             if isinstance(o, set):
                 ans[k] = list(o)
             elif isinstance(o, datetime):
-                ans[k] = o.strftime("%d-%m-%Y %H:%M:%S")
+                ans[k] = o.strftime(DATETIME_FORMAT)
             elif isinstance(o, Decimal):
                 ans[k] = str(o)
             elif isinstance(o, bytes):
@@ -104,11 +142,30 @@ class BaseResponse(object):
             columns (list): A list of columns in the data.
             serialized_data (list): A list of serialized objects from the data.
         """
-        columns = []
         # Returns a list of columns in the data.
-        if len(data) > 0:
-            columns = list(data[0].keys())
-        return columns, [BaseResponse.json_serialize(obj) for obj in data]
+        if len(data) == 0:
+            return [], []
+        columns = list(data[0].keys())
+
+        # Pick a converter per column from its first non null value,
+        # values of another type fall back to a check of their own.
+        converters = []
+        for index, column in enumerate(columns):
+            value = next(
+                (row[column] for row in data if row[column] is not None),
+                None,
+            )
+            if value is None:
+                continue
+            converter = BaseResponse._sql_value_converter(value)
+            converters.append(
+                (index, BaseResponse._typed_converter(type(value), converter))
+            )
+
+        getter = BaseResponse._row_getter(itemgetter, columns)
+        return columns, BaseResponse._rows_to_dicts(
+            data, columns, getter, converters
+        )
 
     @staticmethod
     def model_to_list(data: list, *ignore: str):
@@ -122,12 +179,89 @@ class BaseResponse(object):
         Returns:
             list: A list of dictionaries representing the model objects.
         """
-        return [BaseResponse.model_to_dict(x, *ignore) for x in data]
+        # Only lists of one model are converted by column.
+        model = type(data[0]) if len(data) > 0 else None
+        table = getattr(model, "__table__", None)
+        if table is None or any(type(x) is not model for x in data):
+            return [BaseResponse.model_to_dict(x, *ignore) for x in data]
+
+        # The getter and the datetime columns are resolved once per list.
+        table_columns = [c for c in table.columns if c.name not in ignore]
+        columns = [c.name for c in table_columns]
+        converters = [
+            (index, format_datetime)
+            for index, column in enumerate(table_columns)
+            if isinstance(column.type, DateTime)
+        ]
+        getter = BaseResponse._row_getter(attrgetter, columns)
+        return BaseResponse._rows_to_dicts(data, columns, getter, converters)
+
+    @staticmethod
+    def _sql_value_converter(value: Any) -> Optional[Converter]:
+        for value_type, converter in SQL_VALUE_CONVERTERS:
+            if isinstance(value, value_type):
+                return converter
+        return None
+
+    @staticmethod
+    def _convert_sql_value(value: Any) -> Any:
+        converter = BaseResponse._sql_value_converter(value)
+        if converter is None:
+            return value
+        return converter(value)
+
+    @staticmethod
+    def _typed_converter(
+        value_type: type, converter: Optional[Converter]
+    ) -> Converter:
+        convert_value = BaseResponse._convert_sql_value
+        if converter is None:
+            return lambda value: (
+                value if type(value) is value_type else convert_value(value)
+            )
+        return lambda value: (
+            converter(value)
+            if type(value) is value_type
+            else convert_value(value)
+        )
+
+    @staticmethod
+    def _row_getter(
+        getter_factory: Callable[..., Converter], columns: List[str]
+    ) -> Callable[[Any], tuple]:
+        # attrgetter and itemgetter return a bare value for one name.
+        if len(columns) == 1:
+            get_value = getter_factory(columns[0])
+            return lambda row: (get_value(row),)
+        if len(columns) == 0:
+            return lambda row: ()
+        return getter_factory(*columns)
+
+    @staticmethod
+    def _rows_to_dicts(
+        data: list,
+        columns: List[str],
+        getter: Callable[[Any], tuple],
+        converters: List[Tuple[int, Converter]],
+    ) -> List[dict]:
+        """
+        Read every row as a tuple, convert only the columns that need it
+        and zip the values with the column names.
+        """
+        if not converters:
+            return [dict(zip(columns, getter(row))) for row in data]
+        rows = []
+        for row in data:
+            values = list(getter(row))
+            for index, convert in converters:
+                values[index] = convert(values[index])
+            rows.append(dict(zip(columns, values)))
+        return rows
 
     @staticmethod
     def encode_json(data: Any, *exclude: str):
         """
-        Encodes the given data as a JSON string using the `jsonable_encoder` function.
+        Encodes the given data as a JSON string using the shared `Serializer`.
 
         Args:
             data (Any): The data to be encoded as JSON.
@@ -136,12 +270,23 @@ class BaseResponse(object):
         Returns:
             str: The JSON string representing the encoded data.
         """
-        return jsonable_encoder(
-            data,
-            exclude=exclude,  # type: ignore
-            custom_encoder={
-                datetime: lambda x: x.strftime("%d-%m-%Y %H:%M:%S")
-            },
+        return BaseResponse.serializer.to_jsonable(data, exclude)
+
+    @staticmethod
+    def encode_response(data: Any, *exclude: str) -> JSONBytesResponse:
+        """
+        Encodes the given data to JSON bytes once and wraps them in a
+        response, which FastAPI returns without encoding it again.
+
+        Args:
+            data (Any): The data to be encoded as JSON.
+            *exclude (str): Optional. Any properties to exclude from the JSON encoding.
+
+        Returns:
+            JSONBytesResponse: The response holding the encoded data.
+        """
+        return JSONBytesResponse(
+            BaseResponse.serializer.dumps(data, exclude)
         )
 
     @staticmethod
@@ -156,23 +301,90 @@ class BaseResponse(object):
             exclude (Tuple[str], optional): The keys to be excluded from the response data. Defaults to ().
 
         Returns:
-            str: The JSON-encoded success response.
+            JSONBytesResponse: The JSON-encoded success response.
         """
-        return BaseResponse.encode_json(
+        return BaseResponse.encode_response(
             dict(code=code, msg=msg, data=data), *exclude
         )
 
+    @staticmethod
+    def stream(
+        items: Union[AsyncIterable[Any], Iterable[Any]],
+        code=200,
+        msg="Successfully",
+        exclude=(),
+        chunk_size=64 * 1024,
+    ):
+        """
+        Generate a success response whose data is a JSON array encoded item
+        by item while it is sent.
+
+        Args:
+            items (AsyncIterable | Iterable): The items of the data array.
+                Iterables other than lists and tuples are consumed in a thread.
+            code (int, optional): The status code of the response. Defaults to 200.
+            msg (str, optional): The message of the response. Defaults to "Successfully".
+            exclude (Tuple[str], optional): The keys to be excluded from the items. Defaults to ().
+            chunk_size (int, optional): Encoded items are sent once this many bytes are buffered.
+                It is only a flush threshold, a single large item is buffered whole.
+
+        Returns:
+            StreamingResponse: The streamed success response.
+        """
+        return StreamingResponse(
+            BaseResponse._encode_stream(
+                items, code, msg, exclude, chunk_size
+            ),
+            media_type="application/json",
+        )
+
+    @staticmethod
+    async def _encode_stream(
+        items: Union[AsyncIterable[Any], Iterable[Any]],
+        code: int,
+        msg: str,
+        exclude: Tuple[str, ...],
+        chunk_size: int,
+    ) -> AsyncIterator[bytes]:
+        if isinstance(items, (list, tuple)):
+            items = BaseResponse._iterate(items)
+        elif not hasattr(items, "__aiter__"):
+            # Generators may block, e.g. on a database cursor.
+            items = iterate_in_threadpool(iter(items))
+        # Same envelope as success, the data array is left open.
+        envelope = BaseResponse.serializer.dumps(dict(code=code, msg=msg))
+        buffer = bytearray(envelope[:-1])
+        buffer += b',"data":['
+        first = True
+        async for item in items:
+            if not first:
+                buffer += b","
+            first = False
+            buffer += BaseResponse.serializer.dumps(item, exclude)
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]}"
+        yield bytes(buffer)
+
+    @staticmethod
+    async def _iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+        for item in items:
+            yield item
+
     @staticmethod
     def records(data: list, code=0, msg="Successfully"):
         """
         Static method that takes a list of data,
         an optional code, and an optional message as parameters.
-        Returns a dictionary with keys 'code', 'msg', and 'data',
+        Returns a pre-encoded JSON response with keys 'code', 'msg', and 'data',
         where 'code' and 'msg' default to 200 and 'Successfully' respectively.
         'data' is obtained by calling the 'model_to_list' method of
         the 'BaseResponse' class on the input data list.
         """
-        return dict(code=code, msg=msg, data=BaseResponse.model_to_list(data))
+        return BaseResponse.encode_response(
+            dict(code=code, msg=msg, data=BaseResponse.model_to_list(data))
+        )
 
     @staticmethod
     def success_with_size(data=None, code=0, msg="Successfully", total=0):
@@ -189,30 +401,38 @@ class BaseResponse(object):
         :type total: int, optional
         :return: The JSON encoded response.
         """
+        # Lists of models are converted by column.
+        if isinstance(data, list):
+            data = BaseResponse.model_to_list(data)
         # Returns a JSON encoded response.
         if data is None:
-            return BaseResponse.encode_json(
+            return BaseResponse.encode_response(
                 dict(code=code, msg=msg, data=list(), total=0)
             )
-        return BaseResponse.encode_json(
+        return BaseResponse.encode_response(
             dict(code=code, msg=msg, data=data, total=total)
         )
 
     @staticmethod
-    def failed(error: Error, data=None):
+    def failed(error: Union[ErrorCode, Error], data=None):
         """
-        Creates a dictionary representing a failed response.
+        Creates a failed response.
 
         Parameters:
-            msg (str): The error message.
-            code (int): The error code. Defaults to 110.
+            error (ErrorCode | Error): The error to report.
             data (Any): Additional data to include in the response. Defaults to None.
 
         Returns:
-            dict: A dictionary containing the error code, error message, and additional data if provided.
+            JSONBytesResponse: A response containing the error code, error message, and additional data if provided.
         """
-        return dict(
-            code=error.get_status(), msg=str(error.get_message()), data=data
+        if isinstance(error, Error):
+            error = ErrorCode(error.get_code())
+        # Without data the body is the one encoded with the ErrorCode.
+        # The response itself is new each time, middlewares edit headers.
+        if data is None:
+            return JSONBytesResponse(error.body)
+        return BaseResponse.encode_response(
+            dict(code=error.status, msg=str(error.msg), data=data)
         )
 
     @staticmethod
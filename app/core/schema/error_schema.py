@@ -1,5 +1,6 @@
 from enum import Enum
 
+import orjson
 from pydantic import BaseModel
 
 
@@ -25,6 +26,7 @@ class ErrorCode(str, Enum):
     code: str
     msg: str
     status: int
+    body: bytes
 
     def __new__(cls, code, msg, status) -> "ErrorCode":
         obj = str.__new__(cls, code)
@@ -32,6 +34,8 @@ class ErrorCode(str, Enum):
         obj.code = code
         obj.msg = msg
         obj.status = status
+        # The failed response body, encoded once at import.
+        obj.body = orjson.dumps({"code": status, "msg": msg, "data": None})
         return obj
 
     VALIDATION_ERROR = ("VALIDATION_ERROR", "{0}", 400)
@@ -174,7 +178,7 @@ class ErrorCode(str, Enum):
     )
 
     REQUIRED_GOOGLE_ID = (
-        "REQUIRED_FACEBOOK_ID",
+        "REQUIRED_GOOGLE_ID",
         "Google ID is required",
         400,
     )
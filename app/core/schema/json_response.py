@@ -0,0 +1,20 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class JSONBytesResponse(JSONResponse):
+    """
+    JSON response that accepts already encoded bytes as content.
+
+    BaseResponse hands over the final bytes, so the body is neither walked
+    nor encoded again. Other content, already made JSON compatible by
+    FastAPI, is encoded with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        # Non str keys are allowed like in Serializer.dumps.
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
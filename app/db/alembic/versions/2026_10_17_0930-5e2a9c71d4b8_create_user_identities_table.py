@@ -0,0 +1,64 @@
+"""create user_identities table
+
+Revision ID: 5e2a9c71d4b8
+Revises: 3b3dc5561c5f
+Create Date: 2026-10-17 09:30:12.418305
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c71d4b8"
+down_revision: Union[str, None] = "3b3dc5561c5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_identities",
+        sa.Column(
+            "id",
+            mysql.BIGINT(unsigned=True),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("user_id", mysql.BIGINT(unsigned=True), nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("provider_uid", sa.String(length=100), nullable=False),
+        sa.Column("created_at", mysql.BIGINT(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "provider", "provider_uid", name="uq_user_identities_provider_uid"
+        ),
+    )
+    op.create_index(
+        op.f("ix_user_identities_user_id"),
+        "user_identities",
+        ["user_id"],
+        unique=False,
+    )
+    # Backfill from the social id columns of users.
+    # INSERT IGNORE keeps the first user if an id was stored twice.
+    for provider, column in (
+        ("facebook", "facebook_id"),
+        ("google", "google_id"),
+    ):
+        op.execute(
+            "INSERT IGNORE INTO user_identities "
+            "(user_id, provider, provider_uid, created_at) "
+            f"SELECT id, '{provider}', {column}, UNIX_TIMESTAMP() "
+            f"FROM users WHERE {column} IS NOT NULL AND {column} <> '' "
+            "ORDER BY id"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("user_identities")
@@ -0,0 +1,32 @@
+"""create seed_versions table
+
+Revision ID: c83f1b6e07a2
+Revises: 5e2a9c71d4b8
+Create Date: 2026-10-17 10:15:47.902114
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = "c83f1b6e07a2"
+down_revision: Union[str, None] = "5e2a9c71d4b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "seed_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("fingerprint", sa.CHAR(length=64), nullable=False),
+        sa.Column("updated_at", mysql.BIGINT(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("seed_versions")
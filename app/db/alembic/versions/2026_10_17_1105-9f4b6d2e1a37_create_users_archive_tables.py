@@ -0,0 +1,90 @@
+"""create users_archive and user_tombstones tables
+
+Revision ID: 9f4b6d2e1a37
+Revises: c83f1b6e07a2
+Create Date: 2026-10-17 11:05:21.336802
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = "9f4b6d2e1a37"
+down_revision: Union[str, None] = "c83f1b6e07a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users_archive",
+        sa.Column(
+            "id",
+            mysql.BIGINT(unsigned=True),
+            autoincrement=False,
+            nullable=False,
+        ),
+        sa.Column("user_code", sa.String(length=36), nullable=True),
+        sa.Column("email", sa.String(length=100), nullable=True),
+        sa.Column("phone", sa.String(length=15), nullable=True),
+        sa.Column("hashed_password", sa.String(length=100), nullable=True),
+        sa.Column("is_email_verified", sa.Boolean(), nullable=False),
+        sa.Column("is_phone_verified", sa.Boolean(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=True),
+        sa.Column("sex_code", sa.CHAR(length=1), nullable=True),
+        sa.Column("birthday", sa.Date(), nullable=True),
+        sa.Column("facebook_id", sa.String(length=50), nullable=True),
+        sa.Column(
+            "facebook_access_token", sa.String(length=255), nullable=True
+        ),
+        sa.Column("facebook_username", sa.String(length=50), nullable=True),
+        sa.Column("google_id", sa.String(length=50), nullable=True),
+        sa.Column(
+            "google_access_token", sa.String(length=255), nullable=True
+        ),
+        sa.Column("google_username", sa.String(length=50), nullable=True),
+        sa.Column("created_at", mysql.BIGINT(), nullable=True),
+        sa.Column("updated_at", mysql.BIGINT(), nullable=True),
+        sa.Column("deleted_at", mysql.BIGINT(), nullable=True),
+        sa.Column("archived_at", mysql.BIGINT(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "user_tombstones",
+        sa.Column(
+            "id",
+            mysql.BIGINT(unsigned=True),
+            autoincrement=False,
+            nullable=False,
+        ),
+        sa.Column("user_code", sa.String(length=36), nullable=True),
+        sa.Column("email", sa.String(length=100), nullable=True),
+        sa.Column("phone", sa.String(length=15), nullable=True),
+        sa.Column("hashed_password", sa.String(length=100), nullable=True),
+        sa.Column("sex_code", sa.CHAR(length=1), nullable=True),
+        sa.Column("facebook_id", sa.String(length=50), nullable=True),
+        sa.Column("google_id", sa.String(length=50), nullable=True),
+        sa.Column("deleted_at", mysql.BIGINT(), nullable=False),
+        sa.Column("archived_at", mysql.BIGINT(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for column in ("user_code", "email", "phone", "facebook_id", "google_id"):
+        op.create_index(
+            op.f(f"ix_user_tombstones_{column}"),
+            "user_tombstones",
+            [column],
+            unique=False,
+        )
+    op.create_index(
+        op.f("ix_users_deleted_at"), "users", ["deleted_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_users_deleted_at"), table_name="users")
+    op.drop_table("user_tombstones")
+    op.drop_table("users_archive")
@@ -1,14 +1,30 @@
+import hashlib
+import time
+from typing import Any, Dict, List
+
+import orjson
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import Table
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.orm import Session
 
+from app.core.database import Base
 from app.db.seeds.data.data_protocol import SeedDataProtocol
 from app.db.seeds.data.sex import SeedDataSex
+from app.infra.dto.seed.seed_version_dto import SeedVersionDTO
 
 
 class Seeder:
+    """
+    Applies every dataset whose content changed since the last run.
+
+    Each dataset is fingerprinted and compared with seed_versions. Changed
+    datasets are upserted in batches, rows are never deleted or truncated.
+    """
+
     session: Session
     seed_instances: list[SeedDataProtocol]
+    batch_size: int = 500
 
     def __init__(self, session: Session) -> None:
         self.session = session
@@ -19,16 +35,56 @@ class Seeder:
         try:
             self.session.begin()
             for seed_instance in self.seed_instances:
-                await self._truncate_table(seed_instance.table_name())
-                self.session.add_all(seed_instance.data())
+                await self._seed_table(seed_instance)
             await self.session.commit()
             logger.info("import seeds completed.")
         except Exception:
             await self.session.rollback()
             logger.exception("faild to import seeds!!")
 
-    async def _truncate_table(self, table_name: str) -> None:
-        logger.info(f"truncate table: {table_name}")
-        await self.session.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-        await self.session.execute(text(f"TRUNCATE {table_name}"))
-        await self.session.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+    async def _seed_table(self, seed_instance: SeedDataProtocol) -> None:
+        table_name = seed_instance.table_name()
+        table: Table = Base.metadata.tables[table_name]
+        rows = [
+            {column.name: getattr(dto, column.key) for column in table.columns}
+            for dto in seed_instance.data()
+        ]
+        fingerprint = self._fingerprint(rows)
+
+        version = await self.session.get(SeedVersionDTO, table_name)
+        # Skip datasets that have not changed since they were applied.
+        if version is not None and version.fingerprint == fingerprint:
+            logger.info(f"seed unchanged, skipped: {table_name}")
+            return
+
+        logger.info(f"upsert {len(rows)} rows: {table_name}")
+        for start in range(0, len(rows), self.batch_size):
+            await self._upsert(table, rows[start : start + self.batch_size])
+        await self._upsert(
+            SeedVersionDTO.__table__,
+            [
+                {
+                    "table_name": table_name,
+                    "fingerprint": fingerprint,
+                    "updated_at": int(time.time()),
+                }
+            ],
+        )
+
+    async def _upsert(self, table: Table, rows: List[Dict[str, Any]]) -> None:
+        stmt = insert(table).values(rows)
+        updates = {
+            column.name: stmt.inserted[column.name]
+            for column in table.columns
+            if not column.primary_key
+        }
+        # Tables made only of key columns have nothing to update.
+        if not updates:
+            await self.session.execute(stmt.prefix_with("IGNORE"))
+            return
+        await self.session.execute(stmt.on_duplicate_key_update(updates))
+
+    @staticmethod
+    def _fingerprint(rows: List[Dict[str, Any]]) -> str:
+        encoded = orjson.dumps(rows, default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(encoded).hexdigest()
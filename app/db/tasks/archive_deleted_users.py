@@ -0,0 +1,66 @@
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+sys.path.append("/app")
+
+from app.core.database import AsyncSessionLocal
+from app.core.redis.redis import get_redis
+from app.core.redis.user_cache_repository import CachedUserRepository
+from app.repositories.user.user_archive_repository import (
+    UserArchiveRepository,
+)
+from app.repositories.user.user_repository import UserRepository
+
+
+async def main(args: argparse.Namespace):
+    deleted_before = int(time.time()) - args.days * 24 * 60 * 60
+    archive_repository = UserArchiveRepository()
+    user_cache = CachedUserRepository(UserRepository(), get_redis())
+
+    archived = 0
+    batches = 0
+    while not args.max_batches or batches < args.max_batches:
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as session:
+            ids = await archive_repository.archive_batch(
+                session, deleted_before, args.batch_size
+            )
+        if not ids:
+            break
+        for user_id in ids:
+            await user_cache.invalidate(user_id)
+
+        archived += len(ids)
+        batches += 1
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"batch={batches} archived={archived} took={elapsed:.2f}s"
+        )
+        # Leave the primary and the replica time to catch up between
+        # batches, longer after slow ones.
+        await asyncio.sleep(max(args.pause, elapsed * args.pause_ratio))
+
+    logger.success(f"Archive done: archived={archived} batches={batches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move users deleted more than N days ago to the archive."
+    )
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.5)
+    parser.add_argument("--pause-ratio", type=float, default=1.0)
+    parser.add_argument("--max-batches", type=int, default=0)
+    args = parser.parse_args()
+    try:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(main(args))
+    except Exception:
+        logger.exception("error occured!!")
+        sys.exit(1)
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import sys
+
+from loguru import logger
+
+sys.path.append("/app")
+
+from app.config.config import Config
+from app.core.redis.redis import get_redis
+from app.core.redis.user_session_repository import UserSessionRepository
+from app.helpers import jwt
+
+
+async def main(batch_size: int, dry_run: bool):
+    redis = get_redis()
+    repository = UserSessionRepository(redis=redis)
+    pattern = f"{repository.legacy_session_token}*"
+
+    scanned = migrated = dropped = 0
+    # SCAN walks the keyspace incrementally instead of blocking like KEYS.
+    async for key in redis.scan_iter(match=pattern, count=batch_size):
+        scanned += 1
+        if dry_run:
+            continue
+        user_id = await redis.get(key)
+        # The key was removed by a logout since it was scanned.
+        if user_id is None:
+            continue
+        token = key[len(repository.legacy_session_token) :]
+        try:
+            claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+        except Exception:
+            claims = None
+        if await repository.migrate_legacy_token(token, user_id, claims):
+            migrated += 1
+        else:
+            dropped += 1
+        if scanned % batch_size == 0:
+            logger.info(f"scanned={scanned} migrated={migrated}")
+
+    logger.success(
+        f"Session backfill done: scanned={scanned} migrated={migrated} "
+        f"dropped={dropped} dry_run={dry_run}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move legacy session keys to expiring sid keys."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    try:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(main(args.batch_size, args.dry_run))
+    except Exception:
+        logger.exception("error occured!!")
+        sys.exit(1)
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import csv
+import sys
+
+import orjson
+from loguru import logger
+from sqlalchemy import select
+
+sys.path.append("/app")
+
+from app.core.database import AsyncSessionLocal
+from app.infra.dto.user.user_dto import UserDTO
+
+# Password hashes and social access tokens are never exported.
+EXPORT_COLUMNS = (
+    "id",
+    "user_code",
+    "email",
+    "phone",
+    "is_email_verified",
+    "is_phone_verified",
+    "is_active",
+    "name",
+    "sex_code",
+    "birthday",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+
+
+async def main(path: str, file_format: str, batch_size: int):
+    columns = [UserDTO.__table__.c[name] for name in EXPORT_COLUMNS]
+    # yield_per streams from a server side cursor in batch_size chunks.
+    stmt = (
+        select(*columns)
+        .order_by(UserDTO.id)
+        .execution_options(yield_per=batch_size)
+    )
+    exported = 0
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if file_format == "csv":
+                writer.writerow(EXPORT_COLUMNS)
+            async for partition in result.partitions():
+                for row in partition:
+                    if file_format == "csv":
+                        writer.writerow(row)
+                    else:
+                        f.write(
+                            orjson.dumps(
+                                dict(zip(EXPORT_COLUMNS, row)),
+                                option=orjson.OPT_APPEND_NEWLINE,
+                            ).decode()
+                        )
+                exported += len(partition)
+                logger.info(f"exported={exported}")
+
+    logger.success(f"Export done: {exported} users written to {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Stream the users table to CSV or JSONL."
+    )
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "jsonl"])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    file_format = args.format or (
+        "csv" if args.path.endswith(".csv") else "jsonl"
+    )
+    try:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(main(args.path, file_format, args.batch_size))
+    except Exception:
+        logger.exception("error occured!!")
+        sys.exit(1)
@@ -0,0 +1,221 @@
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+sys.path.append("/app")
+
+from app.core.database import AsyncSessionLocal
+from app.core.entities.user.sex_entity import SexEntity
+from app.core.entities.user.user_entity import UserEntity
+from app.core.schema.user.user_schema import UserEmailCreate, UserPhoneCreate
+from app.helpers.password_service import PasswordService
+from app.infra.dto.user.user_dto import UserDTO
+
+Row = Tuple[int, Dict[str, Any]]
+NewUser = Tuple[UserEntity, str]
+
+
+def read_rows(path: str, file_format: str, skip: int) -> Iterator[Row]:
+    """
+    Yield (line number, row) lazily so that files larger than memory can
+    be imported. The first ``skip`` rows are the ones already imported.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if file_format == "csv":
+            rows = csv.DictReader(f)
+        else:
+            rows = (orjson.loads(line) for line in f if line.strip())
+        for number, row in enumerate(rows, start=1):
+            if number > skip:
+                yield number, row
+
+
+def validate(row: Dict[str, Any]) -> NewUser:
+    """
+    Apply the same rules as the registration endpoints.
+    Returns the user without its hash, and the plain password.
+    """
+    credentials = {
+        "password": row.get("password"),
+        "client_id": None,
+        "client_secret": None,
+    }
+    if row.get("email"):
+        create = UserEmailCreate(email=row["email"], **credentials)
+        user = UserEntity(
+            email=create.email,
+            hashed_password="",
+            sex_code=SexEntity.CODE_NOT_KNOWN,
+        )
+    else:
+        create = UserPhoneCreate(phone=row.get("phone"), **credentials)
+        user = UserEntity(
+            phone=str(create.phone),
+            hashed_password="",
+            sex_code=SexEntity.CODE_NOT_KNOWN,
+        )
+    return user, create.password
+
+
+def read_checkpoint(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return int(f.read().strip() or 0)
+
+
+def write_checkpoint(path: str, line_number: int) -> None:
+    # Replace atomically so that a crash never leaves a torn checkpoint.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(str(line_number))
+    os.replace(tmp_path, path)
+
+
+class UserImporter:
+    def __init__(
+        self,
+        password_service: PasswordService,
+        batch_size: int,
+        mark_verified: bool,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self.password_service = password_service
+        self.batch_size = batch_size
+        self.mark_verified = mark_verified
+        self.session_factory = session_factory
+        self.inserted = 0
+        self.skipped = 0
+        self.invalid = 0
+
+    async def insert_batch(self, new_users: List[NewUser]) -> None:
+        # Hash the whole batch in parallel in the worker processes.
+        hashed_passwords = await asyncio.gather(
+            *(
+                self.password_service.hash(password)
+                for _, password in new_users
+            )
+        )
+        now = int(time.time())
+        values = []
+        for (user, _), hashed_password in zip(new_users, hashed_passwords):
+            user.hashed_password = hashed_password
+            user.is_email_verified = self.mark_verified and bool(user.email)
+            user.is_phone_verified = self.mark_verified and bool(user.phone)
+            user.is_active = True
+            user.generate_user_code_if_empty()
+            row = UserDTO.values_from_entity(user)
+            row.update({"created_at": now, "updated_at": now})
+            values.append(row)
+
+        # One multi-row INSERT, rows with a taken email or phone are left
+        # as they are. Unlike INSERT IGNORE, other errors still fail.
+        stmt = insert(UserDTO).values(values)
+        stmt = stmt.on_duplicate_key_update(id=UserDTO.id)
+        # The affected rows also count duplicates, count the new user codes.
+        user_codes = [row["user_code"] for row in values]
+        count = select(func.count()).where(UserDTO.user_code.in_(user_codes))
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            inserted = (await session.execute(count)).scalar_one()
+            await session.commit()
+        self.inserted += inserted
+        self.skipped += len(values) - inserted
+
+    async def run(
+        self, rows: Iterator[Row], checkpoint_path: Optional[str]
+    ) -> None:
+        started = time.perf_counter()
+        batch: List[NewUser] = []
+        last_line = 0
+        for line_number, row in rows:
+            last_line = line_number
+            try:
+                batch.append(validate(row))
+            except (ValidationError, ValueError, TypeError) as e:
+                self.invalid += 1
+                logger.warning(f"line {line_number} rejected: {e}")
+            if len(batch) >= self.batch_size:
+                await self.flush(batch, last_line, checkpoint_path, started)
+                batch = []
+        await self.flush(batch, last_line, checkpoint_path, started)
+
+    async def flush(
+        self,
+        batch: List[NewUser],
+        last_line: int,
+        checkpoint_path: Optional[str],
+        started: float,
+    ) -> None:
+        if batch:
+            await self.insert_batch(batch)
+        if checkpoint_path and last_line:
+            write_checkpoint(checkpoint_path, last_line)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"line={last_line} inserted={self.inserted} "
+            f"skipped={self.skipped} invalid={self.invalid} "
+            f"rate={self.inserted / elapsed if elapsed else 0:.0f}/s"
+        )
+
+
+async def main(args: argparse.Namespace):
+    file_format = args.format or (
+        "csv" if args.path.endswith(".csv") else "jsonl"
+    )
+    checkpoint_path = args.checkpoint or f"{args.path}.checkpoint"
+    skip = 0 if args.restart else read_checkpoint(checkpoint_path)
+    if skip:
+        logger.info(f"Resuming after line {skip} from {checkpoint_path}")
+
+    password_service = PasswordService(
+        max_workers=args.workers, max_queue=args.batch_size
+    )
+    importer = UserImporter(
+        password_service,
+        batch_size=args.batch_size,
+        mark_verified=args.mark_verified,
+    )
+    try:
+        await importer.run(
+            read_rows(args.path, file_format, skip), checkpoint_path
+        )
+    finally:
+        password_service.shutdown()
+
+    logger.success(
+        f"Import done: inserted={importer.inserted} "
+        f"skipped={importer.skipped} invalid={importer.invalid}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Import users with email or phone from CSV or JSONL."
+    )
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "jsonl"])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--checkpoint")
+    parser.add_argument("--restart", action="store_true")
+    parser.add_argument("--mark-verified", action="store_true")
+    args = parser.parse_args()
+    try:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(main(args))
+    except Exception:
+        logger.exception("error occured!!")
+        sys.exit(1)
@@ -1,17 +1,20 @@
+from typing import Optional
+
 import redis.asyncio
 from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
-import app.core.exceptions.user.user_exceptions as exception
 from app.config.config import Config
 from app.core.database import get_db
-from app.core.entities.user.user_entity import UserEntity
+from app.core.entities.auth.auth_context_entity import AuthContextEntity
+from app.core.entities.user.user_auth_projection import UserAuthProjection
 from app.core.redis.redis import get_redis
+from app.core.redis.user_cache_repository import CachedUserRepository
 from app.core.redis.user_session_repository import UserSessionRepository
 from app.core.schema.base_response import BaseResponse
 from app.core.schema.common_schemas import ClientSecret
-from app.core.schema.error_schema import Error, ErrorCode
+from app.core.schema.error_schema import ErrorCode
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
 )
@@ -31,8 +34,10 @@ from app.usecases.auth.check_verification.check_verification_usecase import (
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
+def user_repository(
+    redis: redis.asyncio.Redis = Depends(get_redis),
+) -> UserRepositoryProtocol:
+    return CachedUserRepository(UserRepository(), redis=redis)
 
 
 def user_session_repository(
@@ -55,36 +60,45 @@ def get_current_user_usecase(
     )
 
 
-def check_verification_usecase(
-    user_repository: UserRepositoryProtocol = Depends(user_repository),
-    user_session_repository: UserSessionRepositoryProtocol = Depends(
-        user_session_repository
-    ),
-    session: Session = Depends(get_db),
-) -> CheckVerificationUseCase:
-    return CheckVerificationInteractor(
-        user_repository=user_repository,
-        user_session_repository=user_session_repository,
-        session=session,
-    )
+def check_verification_usecase() -> CheckVerificationUseCase:
+    return CheckVerificationInteractor()
 
 
-async def get_current_user(
-    request: Request,
+async def get_auth_context(
     token: str = Depends(oauth2_scheme),
     get_current_user_usecase: GetCurrentUserUseCase = Depends(
         get_current_user_usecase
     ),
+) -> Optional[AuthContextEntity]:
+    """
+    Resolve the bearer token once per request.
+
+    FastAPI caches dependency results within a request, so every check and
+    route depending on this shares the same Redis and MySQL lookups.
+    """
+    return await get_current_user_usecase.resolve_auth(token=token)
+
+
+async def authenticate(
+    request: Request,
+    auth_context: Optional[AuthContextEntity] = Depends(get_auth_context),
     check_verification_usecase: CheckVerificationUseCase = Depends(
         check_verification_usecase
     ),
-) -> UserEntity:
-    user = await get_current_user_usecase.get_current_user(token=token)
-    if not user or user.deleted_at:
-        return BaseResponse.failed(Error(ErrorCode.BAD_TOKEN))
+) -> AuthContextEntity:
+    """
+    Guard for routes that need an authenticated user but not its record.
+    Only the auth projection of the user is loaded.
+    """
+    if not auth_context or auth_context.user.deleted_at:
+        return BaseResponse.failed(ErrorCode.BAD_TOKEN)
 
     if (
         (request.method == "POST" and request.url.path == "/auth/logout")
+        or (
+            request.method == "POST"
+            and request.url.path == "/auth/logout-all"
+        )
         or (request.method == "GET" and request.url.path == "/users/account")
         or (
             request.method == "POST"
@@ -95,18 +109,24 @@ async def get_current_user(
             and request.url.path == "/auth/verify/phone/refresh"
         )
     ):
-        return user
+        return auth_context
 
-    try:
-        verified = await check_verification_usecase.check_verification(
-            token=token
-        )
-    except exception.InvalidToken:
-        return BaseResponse.failed(Error(ErrorCode.BAD_TOKEN))
+    verified = await check_verification_usecase.check_verification(
+        auth_context
+    )
     if not verified:
-        return BaseResponse.failed(Error(ErrorCode.NOT_VERIFIED))
+        return BaseResponse.failed(ErrorCode.NOT_VERIFIED)
 
-    return user
+    return auth_context
+
+
+async def get_current_user(
+    auth_context: AuthContextEntity = Depends(authenticate),
+) -> UserAuthProjection:
+    # A failed authentication is passed through as is.
+    if not isinstance(auth_context, AuthContextEntity):
+        return auth_context
+    return auth_context.user
 
 
 def check_client_credential(form_data: ClientSecret):
@@ -116,4 +136,4 @@ def check_client_credential(form_data: ClientSecret):
         or form_data.client_id != Config.CLIENT_ID
         or form_data.client_secret != Config.CLIENT_SECRET
     ):
-        return BaseResponse.failed(Error(ErrorCode.INVALID_CLIENT))
+        return BaseResponse.failed(ErrorCode.INVALID_CLIENT)
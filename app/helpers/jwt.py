@@ -1,5 +1,9 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jwt
 from pydantic import SecretStr
@@ -7,6 +11,8 @@ from pydantic import SecretStr
 from app.config.config import Config
 
 SecretType = Union[str, SecretStr]
+CacheKey = Tuple[bytes, Tuple[str, ...], Tuple[str, ...]]
+CacheEntry = Tuple[Dict[str, Any], Optional[float]]
 
 
 def _get_secret_value(secret: SecretType) -> str:
@@ -16,6 +22,71 @@ def _get_secret_value(secret: SecretType) -> str:
     return secret
 
 
+class ClaimsCache:
+    """
+    Bounded LRU cache of decoded JWT claims.
+
+    Entries are keyed by a SHA-256 digest of the secret and the token, so raw
+    tokens are never kept in memory, and are dropped once their ``exp`` passes.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(encoded_jwt: str, secret: str) -> bytes:
+        return hashlib.sha256(f"{secret}\0{encoded_jwt}".encode()).digest()
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            # Count a miss if the token is unknown or has expired.
+            if entry is None:
+                self.misses += 1
+                return None
+            claims, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return claims
+
+    def put(self, key: CacheKey, claims: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        exp = claims.get("exp")
+        expires_at = float(exp) if exp is not None else None
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries beyond the bound.
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+claims_cache = ClaimsCache(maxsize=Config.JWT_CLAIMS_CACHE_SIZE)
+
+
 def generate_jwt(
     data: dict,
     secret: SecretType,
@@ -42,9 +113,20 @@ def decode_jwt(
     ],
     algorithms: List[str] = [Config.JWT_ALGORITHM],
 ) -> Dict[str, Any]:
-    return jwt.decode(
-        encoded_jwt,
-        _get_secret_value(secret),
-        audience=audience,
-        algorithms=algorithms,
+    secret_value = _get_secret_value(secret)
+    key = (
+        ClaimsCache.digest(encoded_jwt, secret_value),
+        tuple(audience),
+        tuple(algorithms),
     )
+    claims = claims_cache.get(key)
+    # Only verify the signature when the token has not been seen yet.
+    if claims is None:
+        claims = jwt.decode(
+            encoded_jwt,
+            secret_value,
+            audience=audience,
+            algorithms=algorithms,
+        )
+        claims_cache.put(key, claims)
+    return dict(claims)
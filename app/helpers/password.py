@@ -1,14 +1,133 @@
-from typing import Optional, Protocol, Tuple
+import time
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
+from loguru import logger
 from passlib import pwd
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
+from passlib.registry import get_crypt_handler
+
+from app.config.config import Config
+
+BENCHMARK_PASSWORD = "benchmark-password"
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+ARGON2_MIN_TIME_COST = 2
+ARGON2_MAX_TIME_COST = 10
+
+_crypt_context: Optional[CryptContext] = None
+
+
+def available_schemes(schemes: List[str]) -> List[str]:
+    """
+    Keep the schemes whose backend is installed, in order of preference.
+    argon2 requires the optional argon2-cffi package.
+    """
+    available = []
+    for scheme in schemes:
+        try:
+            handler = get_crypt_handler(scheme)
+        except KeyError:
+            logger.warning(f"unknown password hash scheme: {scheme}")
+            continue
+        has_backend = getattr(handler, "has_backend", None)
+        # Skip the scheme if its backend library is not installed.
+        if has_backend is not None and not has_backend():
+            logger.warning(f"no backend available for scheme: {scheme}")
+            continue
+        available.append(scheme)
+    return available or ["bcrypt"]
+
+
+def _measure(scheme: str, repeat: int = 3, **settings: Any) -> float:
+    handler = get_crypt_handler(scheme).using(**settings)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        handler.hash(BENCHMARK_PASSWORD)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def benchmark_bcrypt_rounds(target_seconds: float) -> int:
+    """
+    Pick the largest bcrypt cost whose hash time stays under the target.
+    Each extra round doubles the work, so one measurement is extrapolated.
+    """
+    rounds = BCRYPT_MIN_ROUNDS
+    elapsed = _measure("bcrypt", rounds=rounds)
+    while rounds < BCRYPT_MAX_ROUNDS and elapsed * 2 <= target_seconds:
+        rounds += 1
+        elapsed *= 2
+    return rounds
+
+
+def benchmark_argon2_time_cost(target_seconds: float) -> int:
+    """
+    Pick the argon2 time cost closest to the target.
+    The work grows linearly with the number of passes.
+    """
+    elapsed = _measure(
+        "argon2",
+        time_cost=ARGON2_MIN_TIME_COST,
+        memory_cost=Config.PASSWORD_ARGON2_MEMORY_KIB,
+    )
+    per_pass = elapsed / ARGON2_MIN_TIME_COST
+    time_cost = int(target_seconds / per_pass) if per_pass else 0
+    return max(ARGON2_MIN_TIME_COST, min(ARGON2_MAX_TIME_COST, time_cost))
+
+
+def build_crypt_context(
+    schemes: Optional[List[str]] = None,
+    target_ms: Optional[int] = None,
+) -> CryptContext:
+    """
+    Build the shared CryptContext.
+
+    The first available scheme hashes new passwords; the others are only
+    used to verify existing hashes and are flagged for rehash. With a
+    positive target the cost of the default scheme is tuned to this host.
+    """
+    schemes = available_schemes(schemes or Config.PASSWORD_HASH_SCHEMES)
+    if target_ms is None:
+        target_ms = Config.PASSWORD_HASH_TARGET_MS
+    target_seconds = target_ms / 1000
+
+    settings: Dict[str, Any] = {}
+    if "bcrypt" in schemes:
+        rounds = Config.PASSWORD_BCRYPT_ROUNDS
+        if schemes[0] == "bcrypt" and target_seconds > 0:
+            rounds = benchmark_bcrypt_rounds(target_seconds)
+        # Hashes below the default cost are reported as needing an update.
+        settings["bcrypt__default_rounds"] = rounds
+        settings["bcrypt__min_rounds"] = rounds
+    if "argon2" in schemes:
+        time_cost = ARGON2_MIN_TIME_COST
+        if schemes[0] == "argon2" and target_seconds > 0:
+            time_cost = benchmark_argon2_time_cost(target_seconds)
+        settings["argon2__time_cost"] = time_cost
+        settings["argon2__memory_cost"] = Config.PASSWORD_ARGON2_MEMORY_KIB
+
+    logger.info(f"password hashing: schemes={schemes} settings={settings}")
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+
+def get_crypt_context() -> CryptContext:
+    global _crypt_context
+    if _crypt_context is None:
+        _crypt_context = build_crypt_context()
+    return _crypt_context
+
+
+def set_crypt_context(context: CryptContext) -> None:
+    global _crypt_context
+    _crypt_context = context
 
 
 class PasswordHelperProtocol(Protocol):
     def verify_and_update(
         self, plain_password: str, hashed_password: str
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, Optional[str]]:
         ...  # pragma: no cover
 
     def hash(self, password: str) -> str:
@@ -20,16 +139,21 @@ class PasswordHelperProtocol(Protocol):
 
 class PasswordHelper(PasswordHelperProtocol):
     def __init__(self, context: Optional[CryptContext] = None) -> None:
-        # Set the context to use for the cryptographic context.
+        # Share the process wide context unless one is given explicitly.
         if context is None:
-            self.context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+            self.context = get_crypt_context()
         else:
             self.context = context  # pragma: no cover
 
     def verify_and_update(
         self, plain_password: str, hashed_password: str
-    ) -> Tuple[bool, str]:
-        return self.context.verify_and_update(plain_password, hashed_password)
+    ) -> Tuple[bool, Optional[str]]:
+        try:
+            return self.context.verify_and_update(
+                plain_password, hashed_password
+            )
+        except UnknownHashError:
+            return False, None
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         try:
@@ -0,0 +1,170 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+from passlib.context import CryptContext
+
+from app.config.config import Config
+from app.helpers.password import (
+    PasswordHelper,
+    get_crypt_context,
+    set_crypt_context,
+)
+
+
+class PasswordServiceBusy(Exception):
+    pass
+
+
+_worker_password_helper: Optional[PasswordHelper] = None
+
+
+def _init_worker(context_config: str) -> None:
+    # Workers reuse the parent's tuned settings instead of benchmarking again.
+    set_crypt_context(CryptContext.from_string(context_config))
+
+
+def _password_helper() -> PasswordHelper:
+    # One helper per worker process, built on first use.
+    global _worker_password_helper
+    if _worker_password_helper is None:
+        _worker_password_helper = PasswordHelper()
+    return _worker_password_helper
+
+
+def _hash(password: str) -> str:
+    return _password_helper().hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return _password_helper().verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return _password_helper().verify_and_update(
+        plain_password, hashed_password
+    )
+
+
+class PasswordServiceProtocol(Protocol):
+    async def hash(self, password: str) -> str:
+        ...  # pragma: no cover
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        ...  # pragma: no cover
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        ...  # pragma: no cover
+
+
+class PasswordService(PasswordServiceProtocol):
+    """
+    Runs the CPU-bound password hashing off the event loop.
+
+    Calls are executed in a process pool. When more than ``max_queue``
+    calls are pending the service fails fast with PasswordServiceBusy
+    instead of letting the backlog grow without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+
+        self.pending = 0
+        self.peak_pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await self._run(
+            _verify_and_update, plain_password, hashed_password
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_seconds": self.total_seconds / self.completed
+            if self.completed
+            else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # spawn avoids forking a process that already runs an event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(get_crypt_context().to_string(),),
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        # Reject instead of queueing when the pool is saturated.
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise PasswordServiceBusy()
+
+        self.pending += 1
+        self.submitted += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        # Only successful calls count towards the timings.
+        elapsed = time.perf_counter() - started
+        self.completed += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        return result
+
+
+password_service = PasswordService(
+    max_workers=Config.PASSWORD_HASH_WORKERS,
+    max_queue=Config.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+def get_password_service() -> PasswordService:
+    return password_service
@@ -0,0 +1,123 @@
+import dataclasses
+from enum import Enum
+from pathlib import PurePath
+from types import GeneratorType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+import orjson
+from pydantic import BaseModel
+from pydantic.json import ENCODERS_BY_TYPE
+
+Encoder = Callable[[Any, FrozenSet[str]], Any]
+
+NO_EXCLUDE: FrozenSet[str] = frozenset()
+PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+SEQUENCE_TYPES = (list, tuple, set, frozenset, GeneratorType)
+
+
+class Serializer:
+    """
+    Converts objects to JSON compatible values like
+    ``app.helpers.encoder.jsonable_encoder``.
+
+    The way a type is encoded is resolved once, on first sight, and the
+    resulting encoder is cached per concrete type. ``type_encoders`` take
+    precedence over the defaults for the given types and their subclasses.
+    The values of a pydantic model also go through the ``json_encoders`` of
+    its config, which ``type_encoders`` override.
+    """
+
+    def __init__(
+        self, type_encoders: Optional[Dict[type, Callable[[Any], Any]]] = None
+    ) -> None:
+        self.type_encoders = dict(type_encoders or {})
+        self._encoders: Dict[type, Encoder] = {}
+
+    def to_jsonable(self, obj: Any, exclude: Iterable[str] = ()) -> Any:
+        """
+        ``exclude`` drops keys from every dict found in obj, at any depth,
+        and fields of pydantic models. The values of models and dataclasses
+        are encoded without it.
+        """
+        return self._encode(obj, frozenset(exclude))
+
+    def dumps(self, obj: Any, exclude: Iterable[str] = ()) -> bytes:
+        return orjson.dumps(
+            self.to_jsonable(obj, exclude), option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def _encode(self, obj: Any, exclude: FrozenSet[str]) -> Any:
+        obj_type = type(obj)
+        # Fast path, primitives are returned as is.
+        if obj_type in PRIMITIVE_TYPES and obj_type not in self.type_encoders:
+            return obj
+        encoder = self._encoders.get(obj_type)
+        if encoder is None:
+            encoder = self._encoders[obj_type] = self._build(obj_type)
+        return encoder(obj, exclude)
+
+    def _build(self, obj_type: type) -> Encoder:
+        for base in obj_type.__mro__:
+            if base in self.type_encoders:
+                custom = self.type_encoders[base]
+                return lambda obj, exclude: custom(obj)
+        if issubclass(obj_type, BaseModel):
+            json_encoders = getattr(obj_type.__config__, "json_encoders", {})
+            if not json_encoders:
+                return self._encode_model
+            # Same precedence as jsonable_encoder with a custom_encoder.
+            model_serializer = Serializer(
+                {**json_encoders, **self.type_encoders}
+            )
+            return model_serializer._encode_model
+        if dataclasses.is_dataclass(obj_type):
+            return lambda obj, exclude: self._encode(
+                dataclasses.asdict(obj), NO_EXCLUDE
+            )
+        if issubclass(obj_type, Enum):
+            return lambda obj, exclude: self._encode(obj.value, exclude)
+        if issubclass(obj_type, PurePath):
+            return lambda obj, exclude: str(obj)
+        if issubclass(obj_type, PRIMITIVE_TYPES):
+            return lambda obj, exclude: obj
+        if issubclass(obj_type, dict):
+            return self._encode_dict
+        if issubclass(obj_type, SEQUENCE_TYPES):
+            return lambda obj, exclude: [
+                self._encode(item, exclude) for item in obj
+            ]
+        for base in obj_type.__mro__:
+            if base in ENCODERS_BY_TYPE:
+                default = ENCODERS_BY_TYPE[base]
+                return lambda obj, exclude: default(obj)
+        return self._encode_object
+
+    def _encode_model(self, obj: BaseModel, exclude: FrozenSet[str]) -> Any:
+        data = obj.dict(by_alias=True, exclude=set(exclude) or None)
+        if "__root__" in data:
+            data = data["__root__"]
+        return self._encode(data, NO_EXCLUDE)
+
+    def _encode_dict(self, obj: dict, exclude: FrozenSet[str]) -> dict:
+        encoded = {}
+        for key, value in obj.items():
+            # Skip the SQLAlchemy instance state.
+            if isinstance(key, str) and key.startswith("_sa"):
+                continue
+            if key in exclude:
+                continue
+            encoded[self._encode(key, exclude)] = self._encode(value, exclude)
+        return encoded
+
+    def _encode_object(self, obj: Any, exclude: FrozenSet[str]) -> Any:
+        errors = []
+        try:
+            data = dict(obj)
+        except Exception as e:
+            errors.append(e)
+            try:
+                data = vars(obj)
+            except Exception as e:
+                errors.append(e)
+                raise ValueError(errors)
+        return self._encode_dict(data, exclude)
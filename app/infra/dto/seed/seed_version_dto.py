@@ -0,0 +1,12 @@
+from sqlalchemy import CHAR, Column, String
+from sqlalchemy.dialects.mysql import BIGINT
+
+from app.core.database import Base
+
+
+class SeedVersionDTO(Base):
+    __tablename__ = "seed_versions"
+
+    table_name: str | Column = Column(String(64), primary_key=True)
+    fingerprint: str | Column = Column(CHAR(64), nullable=False)
+    updated_at: int | Column = Column(BIGINT, nullable=False)
@@ -0,0 +1,42 @@
+import datetime
+
+from sqlalchemy import CHAR, Boolean, Column, Date, String
+from sqlalchemy.dialects.mysql import BIGINT
+
+from app.core.database import Base
+
+
+class UserArchiveDTO(Base):
+    """
+    Users deleted long ago, moved out of ``users`` by the archival job.
+    The columns mirror ``users`` without its unique indexes.
+    """
+
+    __tablename__ = "users_archive"
+
+    id: int | Column = Column(
+        BIGINT(unsigned=True), primary_key=True, autoincrement=False
+    )
+    user_code: str | Column = Column(String(36), nullable=True)
+    email: str | Column = Column(String(100), nullable=True)
+    phone: str | Column = Column(String(15), nullable=True)
+    hashed_password: str | Column = Column(String(100), nullable=True)
+    is_email_verified: bool | Column = Column(Boolean, nullable=False)
+    is_phone_verified: bool | Column = Column(Boolean, nullable=False)
+    is_active: bool | Column = Column(Boolean, nullable=False)
+    name: str | Column = Column(String(50), nullable=True)
+    sex_code: str | Column = Column(CHAR(1), nullable=True)
+    birthday: datetime.date | Column = Column(Date, nullable=True)
+
+    facebook_id: str | Column = Column(String(50), nullable=True)
+    facebook_access_token: str | Column = Column(String(255), nullable=True)
+    facebook_username: str | Column = Column(String(50), nullable=True)
+
+    google_id: str | Column = Column(String(50), nullable=True)
+    google_access_token: str | Column = Column(String(255), nullable=True)
+    google_username: str | Column = Column(String(50), nullable=True)
+
+    created_at: int | Column = Column(BIGINT, nullable=True)
+    updated_at: int | Column = Column(BIGINT, nullable=True)
+    deleted_at: int | Column = Column(BIGINT, nullable=True)
+    archived_at: int | Column = Column(BIGINT, nullable=False)
@@ -1,5 +1,6 @@
 import datetime
 import time
+from typing import Any, Dict, Iterable, Optional
 
 from sqlalchemy import CHAR, Boolean, Column, Date, ForeignKey, String
 from sqlalchemy.dialects.mysql import BIGINT
@@ -13,6 +14,27 @@ from app.infra.dto.user.sex_dto import SexDTO
 class UserDTO(Base):
     __tablename__ = "users"
 
+    # Entity fields that map one to one onto a writable column.
+    UPDATABLE_FIELDS = (
+        "user_code",
+        "email",
+        "phone",
+        "hashed_password",
+        "is_email_verified",
+        "is_phone_verified",
+        "is_active",
+        "name",
+        "sex_code",
+        "birthday",
+        "facebook_id",
+        "facebook_access_token",
+        "facebook_username",
+        "google_id",
+        "google_access_token",
+        "google_username",
+        "deleted_at",
+    )
+
     id: int | Column = Column(
         BIGINT(unsigned=True), primary_key=True, autoincrement=True
     )
@@ -53,7 +75,8 @@ class UserDTO(Base):
     updated_at: int | Column = Column(
         BIGINT, default=int(time.time()), onupdate=int(time.time())
     )
-    deleted_at: int | Column = Column(BIGINT, nullable=True)
+    # Scanned by the archival job.
+    deleted_at: int | Column = Column(BIGINT, index=True, nullable=True)
 
     sex: SexDTO = relationship("SexDTO", lazy="joined")
 
@@ -105,6 +128,22 @@ class UserDTO(Base):
             user.deleted_at.timestamp() if user.deleted_at else None
         )
 
+    @classmethod
+    def values_from_entity(
+        cls, user: UserEntity, fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Column values of the given entity fields, all of them by default.
+        """
+        values = {}
+        for name in cls.UPDATABLE_FIELDS if fields is None else fields:
+            if name not in cls.UPDATABLE_FIELDS:
+                raise ValueError(f"{name} is not an updatable user field")
+            values[name] = getattr(user, name)
+        if values.get("deleted_at"):
+            values["deleted_at"] = int(values["deleted_at"].timestamp())
+        return values
+
     @classmethod
     def from_entity(cls, user: UserEntity) -> "UserDTO":
         dto = UserDTO(
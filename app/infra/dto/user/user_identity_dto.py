@@ -0,0 +1,48 @@
+import time
+
+from sqlalchemy import Column, ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.mysql import BIGINT
+
+from app.core.database import Base
+from app.core.entities.user.user_identity_entity import UserIdentityEntity
+
+
+class UserIdentityDTO(Base):
+    __tablename__ = "user_identities"
+    __table_args__ = (
+        UniqueConstraint(
+            "provider", "provider_uid", name="uq_user_identities_provider_uid"
+        ),
+    )
+
+    id: int | Column = Column(
+        BIGINT(unsigned=True), primary_key=True, autoincrement=True
+    )
+    user_id: int | Column = Column(
+        BIGINT(unsigned=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    provider: str | Column = Column(String(20), nullable=False)
+    provider_uid: str | Column = Column(String(100), nullable=False)
+    created_at: int | Column = Column(
+        BIGINT, default=lambda: int(time.time())
+    )
+
+    def to_entity(self) -> UserIdentityEntity:
+        return UserIdentityEntity(
+            id=self.id,
+            user_id=self.user_id,
+            provider=self.provider,
+            provider_uid=self.provider_uid,
+        )
+
+    @staticmethod
+    def from_entity(identity: UserIdentityEntity) -> "UserIdentityDTO":
+        return UserIdentityDTO(
+            id=identity.id,
+            user_id=identity.user_id,
+            provider=identity.provider,
+            provider_uid=identity.provider_uid,
+        )
@@ -0,0 +1,56 @@
+import datetime
+
+from sqlalchemy import CHAR, Column, String
+from sqlalchemy.dialects.mysql import BIGINT
+
+from app.core.database import Base
+from app.core.entities.user.user_entity import UserEntity
+
+
+class UserTombstoneDTO(Base):
+    """
+    What remains of an archived user for lookups: the keys it was found
+    by and enough to be reported as deleted.
+    """
+
+    __tablename__ = "user_tombstones"
+
+    # Tombstone columns copied from users, in the same order.
+    USER_COLUMNS = (
+        "id",
+        "user_code",
+        "email",
+        "phone",
+        "hashed_password",
+        "sex_code",
+        "facebook_id",
+        "google_id",
+        "deleted_at",
+    )
+
+    id: int | Column = Column(
+        BIGINT(unsigned=True), primary_key=True, autoincrement=False
+    )
+    user_code: str | Column = Column(String(36), index=True, nullable=True)
+    email: str | Column = Column(String(100), index=True, nullable=True)
+    phone: str | Column = Column(String(15), index=True, nullable=True)
+    hashed_password: str | Column = Column(String(100), nullable=True)
+    sex_code: str | Column = Column(CHAR(1), nullable=True)
+    facebook_id: str | Column = Column(String(50), index=True, nullable=True)
+    google_id: str | Column = Column(String(50), index=True, nullable=True)
+    deleted_at: int | Column = Column(BIGINT, nullable=False)
+    archived_at: int | Column = Column(BIGINT, nullable=False)
+
+    def to_entity(self) -> UserEntity:
+        return UserEntity(
+            id=self.id,
+            user_code=self.user_code,
+            email=self.email,
+            phone=self.phone,
+            hashed_password=self.hashed_password,
+            sex_code=self.sex_code,
+            facebook_id=self.facebook_id,
+            google_id=self.google_id,
+            is_active=False,
+            deleted_at=datetime.datetime.fromtimestamp(self.deleted_at),
+        )
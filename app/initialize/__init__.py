@@ -20,11 +20,21 @@ from app.core.exceptions import (
     ServiceUnavailableException,
     UnauthorizedException,
 )
+from app.core.schema.json_response import JSONBytesResponse
 
 if os.getenv("APP_ENV") == "production":
-    journeyLingua = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+    journeyLingua = FastAPI(
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        default_response_class=JSONBytesResponse,
+    )
 else:
-    journeyLingua = FastAPI(title=Config.API_TITLE, version=Config.VERSION)
+    journeyLingua = FastAPI(
+        title=Config.API_TITLE,
+        version=Config.VERSION,
+        default_response_class=JSONBytesResponse,
+    )
 
 INFO_FORMAT = (
     "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> "
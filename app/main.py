@@ -1,7 +1,11 @@
 from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 
 from app.config.config import BANNER, JOURNEY_LINGUA_ENV, Config
+from app.core.database import replica_monitor
 from app.core.redis.redis import get_redis
+from app.helpers.password import get_crypt_context
+from app.helpers.password_service import get_password_service
 from app.initialize import init_logging, journeyLingua
 from app.routers.auth import (
     login_route,
@@ -58,6 +62,9 @@ async def startup_event():
 @journeyLingua.on_event("shutdown")
 async def shutdown_event():
     await get_redis().close()
+    get_password_service().shutdown()
+    if replica_monitor:
+        await replica_monitor.stop()
 
 
 @journeyLingua.on_event("startup")
@@ -69,3 +76,16 @@ async def init_database():
             f"Database and tables  created failed: ❌\nError: {e}"
         )
         raise
+
+
+@journeyLingua.on_event("startup")
+async def init_password_hashing():
+    # Benchmark the hash cost once before the first login needs it.
+    await run_in_threadpool(get_crypt_context)
+
+
+@journeyLingua.on_event("startup")
+async def init_read_replica():
+    if replica_monitor:
+        await replica_monitor.check()
+        replica_monitor.start()
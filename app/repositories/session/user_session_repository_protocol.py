@@ -1,15 +1,20 @@
-from typing import Protocol
+from typing import Any, Dict, Optional, Protocol
 
 from app.core.entities.user.user_entity import UserEntity
 from app.core.schema.common_schemas import LoginType
 
 
 class UserSessionRepositoryProtocol(Protocol):
-    async def read_token(self, token: str) -> UserEntity:
+    async def read_token(
+        self, token: str, claims: Dict[str, Any]
+    ) -> Optional[int]:
         ...  # pragma: no cover
 
     async def write_token(self, user: UserEntity, login_type: LoginType) -> str:
         ...  # pragma: no cover
 
-    async def destroy_token(self, token: str) -> str:
+    async def destroy_token(self, token: str, claims: Dict[str, Any]) -> None:
+        ...  # pragma: no cover
+
+    async def destroy_all_tokens(self, user_id: int) -> int:
         ...  # pragma: no cover
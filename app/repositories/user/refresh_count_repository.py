@@ -1,10 +1,12 @@
-from typing import Protocol
+from typing import Protocol, Tuple
 
 from app.core.entities.user.user_entity import UserEntity
 
 
 class RefreshCountRepositoryProtocol(Protocol):
-    async def write_count(self, user_entity: UserEntity) -> None:
+    async def increment_count(
+        self, user_entity: UserEntity, limit: int
+    ) -> Tuple[int, bool]:
         ...  # pragma: no cover
 
     async def read_count(self, user_entity: UserEntity) -> int:
@@ -0,0 +1,86 @@
+import time
+from typing import List
+
+from sqlalchemy import delete, insert, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.infra.dto.user.user_archive_dto import UserArchiveDTO
+from app.infra.dto.user.user_dto import UserDTO
+from app.infra.dto.user.user_identity_dto import UserIdentityDTO
+from app.infra.dto.user.user_tombstone_dto import UserTombstoneDTO
+from app.utils.logger import Log
+
+
+class UserArchiveRepository:
+    """
+    Moves soft-deleted users to ``users_archive`` and leaves a row in
+    ``user_tombstones`` so that lookups still report them as deleted.
+    """
+
+    log = Log("UserArchiveRepository")
+
+    async def archive_batch(
+        self, session: AsyncSession, deleted_before: int, limit: int
+    ) -> List[int]:
+        """
+        Archive up to ``limit`` users deleted before the given timestamp
+        in one short transaction. Returns the archived ids.
+        """
+        users = UserDTO.__table__
+        # Rows locked by another job are left for the next batch.
+        ids_stmt = (
+            select(UserDTO.id)
+            .where(
+                UserDTO.deleted_at.is_not(None),
+                UserDTO.deleted_at < deleted_before,
+            )
+            .order_by(UserDTO.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        ids = list((await session.execute(ids_stmt)).scalars())
+        if not ids:
+            await session.rollback()
+            return ids
+
+        archived_at = int(time.time())
+        archive_columns = [
+            column.name for column in UserArchiveDTO.__table__.columns
+        ]
+        await session.execute(
+            insert(UserArchiveDTO).from_select(
+                archive_columns,
+                select(
+                    *(
+                        users.c[name]
+                        if name != "archived_at"
+                        else literal(archived_at)
+                        for name in archive_columns
+                    )
+                ).where(users.c.id.in_(ids)),
+            )
+        )
+        await session.execute(
+            insert(UserTombstoneDTO).from_select(
+                [*UserTombstoneDTO.USER_COLUMNS, "archived_at"],
+                select(
+                    *(users.c[name] for name in UserTombstoneDTO.USER_COLUMNS),
+                    literal(archived_at),
+                ).where(users.c.id.in_(ids)),
+            )
+        )
+        # Identities would cascade, deleting them first keeps it explicit.
+        await session.execute(
+            delete(UserIdentityDTO)
+            .where(UserIdentityDTO.user_id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(
+            delete(UserDTO)
+            .where(UserDTO.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        self.log.info(f"Archived users. count={len(ids)}")
+        return ids
@@ -1,12 +1,20 @@
-from typing import Any, Optional
+import dataclasses
+import datetime
+import time
+from typing import Any, Iterable, List, Optional, Type
 
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.core.entities.user.user_auth_projection import ProjectionT
 from app.core.entities.user.user_entity import UserEntity
+from app.core.entities.user.user_identity_entity import UserIdentityEntity
 from app.core.exceptions.user.user_exceptions import UserNotExists
 from app.infra.dto.user.user_dto import UserDTO
+from app.infra.dto.user.user_identity_dto import UserIdentityDTO
+from app.infra.dto.user.user_tombstone_dto import UserTombstoneDTO
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
 )
@@ -16,41 +24,125 @@ from app.utils.logger import Log
 class UserRepository(UserRepositoryProtocol):
     log = Log("UserRepository")
 
+    USER_CODE_RETRIES = 3
+    USER_CODE_INDEX = "ix_users_user_code"
+    # users columns mirrored by a user_identities row.
+    IDENTITY_COLUMNS = {
+        "facebook_id": UserIdentityEntity.PROVIDER_FACEBOOK,
+        "google_id": UserIdentityEntity.PROVIDER_GOOGLE,
+    }
+    TOMBSTONE_KEYS = (
+        "id",
+        "user_code",
+        "email",
+        "phone",
+        "facebook_id",
+        "google_id",
+    )
+
     async def create(
         self, session: AsyncSession, user: UserEntity
     ) -> UserEntity:
-        user_dto = UserDTO.from_entity(user)
-        session.begin_nested()
-        session.add(user_dto)
+        """
+        Insert the user with its user_code in a single INSERT.
+        A generated code that hits the unique index is drawn again.
+        """
+        generated = not user.user_code
+        for attempt in range(self.USER_CODE_RETRIES):
+            user.generate_user_code_if_empty()
+            user_dto = UserDTO.from_entity(user)
+            try:
+                # A savepoint keeps the caller's transaction usable on retry.
+                async with session.begin_nested():
+                    session.add(user_dto)
+                    await session.flush()
+                    session.add_all(
+                        UserIdentityDTO.from_entity(identity)
+                        for identity in self._identities(user_dto.id, user)
+                    )
+            except IntegrityError as e:
+                if (
+                    not generated
+                    or self.USER_CODE_INDEX not in str(e.orig)
+                    or attempt == self.USER_CODE_RETRIES - 1
+                ):
+                    raise
+                self.log.info("user_code collision, drawing a new one.")
+                user.user_code = None
+                continue
+            break
         await session.commit()
         await session.refresh(user_dto)
         self.log.info(f"Created a user. id={user_dto.id}")
         return user_dto.to_entity()
 
     async def update(
-        self, session: AsyncSession, user: UserEntity
+        self,
+        session: AsyncSession,
+        user: UserEntity,
+        fields: Iterable[str],
     ) -> UserEntity:
-        if user.id is None:
+        """
+        Write the given fields with a single UPDATE. The fields are
+        required so that a partly loaded user cannot overwrite columns it
+        does not hold. The returned entity is built from the input without
+        reading back.
+        """
+        fields = list(fields)
+        if user.id is None or not fields:
             raise ValueError
 
-        user_dto: UserDTO = await self._find_by_id(session, user.id)
-        if user_dto is None:
-            raise UserNotExists
-        session.begin_nested()
-        user_dto.set_from_entity(user)
+        values = UserDTO.values_from_entity(user, fields)
+        updated_at = int(time.time())
+        values["updated_at"] = updated_at
+        stmt = (
+            update(UserDTO)
+            .where(UserDTO.id == user.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        # The user row and its identities change in one savepoint.
+        async with session.begin_nested():
+            result = await session.execute(stmt)
+            if result.rowcount == 0:
+                raise UserNotExists
+            await self._sync_identities(session, user, fields)
         await session.commit()
-        await session.refresh(user_dto)
-        self.log.info(f"Updated user to {user_dto.to_entity()}.")
-        return user_dto.to_entity()
+        self.log.info(f"Updated user. id={user.id} fields={list(values)}")
+        return dataclasses.replace(
+            user, updated_at=datetime.datetime.fromtimestamp(updated_at)
+        )
 
     async def find_by_id(
-        self, session: AsyncSession, id: int
+        self, session: AsyncSession, id: int, read_replica: bool = True
     ) -> Optional[UserEntity]:
-        dto: UserDTO = await self._find_by_id(session, id)
+        """
+        read_replica=False reads the primary, for callers that must not
+        see a lagging copy of the user.
+        """
+        dto: UserDTO = await self._find_by_id(session, id, read_replica)
         if dto is None:
             return None
         return dto.to_entity()
 
+    async def find_projection_by_id(
+        self, session: AsyncSession, id: int, projection: Type[ProjectionT]
+    ) -> Optional[ProjectionT]:
+        """
+        Select only the columns named by the projection's fields, without
+        building ORM objects or joining the sex table.
+        """
+        columns = [UserDTO.__table__.c[name] for name in projection._fields]
+        stmt = (
+            select(*columns)
+            .where(UserDTO.id == id)
+            .execution_options(read_replica=True)
+        )
+        row = (await session.execute(stmt)).first()
+        if row is None:
+            return None
+        return projection._make(row)
+
     async def find_by_email(
         self, session: AsyncSession, email: str
     ) -> Optional[UserEntity]:
@@ -74,7 +166,29 @@ class UserRepository(UserRepositoryProtocol):
     async def find_by_facebook_id(
         self, session: AsyncSession, facebook_id: str
     ) -> Optional[UserEntity]:
-        stmt = select(UserDTO).where(UserDTO.facebook_id == facebook_id)
+        return await self.find_by_social_id(
+            session, UserIdentityEntity.PROVIDER_FACEBOOK, facebook_id
+        )
+
+    async def find_by_google_id(
+        self, session: AsyncSession, google_id: str
+    ) -> Optional[UserEntity]:
+        return await self.find_by_social_id(
+            session, UserIdentityEntity.PROVIDER_GOOGLE, google_id
+        )
+
+    async def find_by_social_id(
+        self, session: AsyncSession, provider: str, provider_uid: str
+    ) -> Optional[UserEntity]:
+        # Served by the unique (provider, provider_uid) index.
+        stmt = (
+            select(UserDTO)
+            .join(UserIdentityDTO, UserIdentityDTO.user_id == UserDTO.id)
+            .where(
+                UserIdentityDTO.provider == provider,
+                UserIdentityDTO.provider_uid == provider_uid,
+            )
+        )
         try:
             user_dto = await self._find_one(session, stmt)
         except NoResultFound:
@@ -91,13 +205,91 @@ class UserRepository(UserRepositoryProtocol):
             return None
         return user_dto.to_entity()
 
-    async def _find_one(self, session: AsyncSession, stmt: Any) -> UserDTO:
-        result = await session.execute(stmt)
+    async def find_tombstone(
+        self, session: AsyncSession, key: str, value: Any
+    ) -> Optional[UserEntity]:
+        """
+        Find an archived user by one of TOMBSTONE_KEYS, reported as
+        deleted. The find_* methods do not look at archived users, only
+        flows that need to tell them apart call this, on the primary.
+        """
+        if key not in self.TOMBSTONE_KEYS:
+            raise ValueError(f"Unknown tombstone key: {key}")
+        stmt = (
+            select(UserTombstoneDTO)
+            .where(getattr(UserTombstoneDTO, key) == value)
+            .order_by(UserTombstoneDTO.id.desc())
+            .limit(1)
+        )
+        dto = (await session.execute(stmt)).scalars().first()
+        if dto is None:
+            return None
+        return dto.to_entity()
+
+    @staticmethod
+    def _identities(
+        user_id: int, user: UserEntity
+    ) -> List[UserIdentityEntity]:
+        identities = []
+        if user.facebook_id:
+            identities.append(
+                UserIdentityEntity(
+                    user_id=user_id,
+                    provider=UserIdentityEntity.PROVIDER_FACEBOOK,
+                    provider_uid=user.facebook_id,
+                )
+            )
+        if user.google_id:
+            identities.append(
+                UserIdentityEntity(
+                    user_id=user_id,
+                    provider=UserIdentityEntity.PROVIDER_GOOGLE,
+                    provider_uid=user.google_id,
+                )
+            )
+        return identities
+
+    async def _sync_identities(
+        self, session: AsyncSession, user: UserEntity, fields: List[str]
+    ) -> None:
+        # Social logins resolve through user_identities, keep them in step
+        # with the social id columns written by the UPDATE.
+        providers = [
+            provider
+            for column, provider in self.IDENTITY_COLUMNS.items()
+            if column in fields
+        ]
+        if not providers:
+            return
+        await session.execute(
+            delete(UserIdentityDTO)
+            .where(
+                UserIdentityDTO.user_id == user.id,
+                UserIdentityDTO.provider.in_(providers),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        session.add_all(
+            UserIdentityDTO.from_entity(identity)
+            for identity in self._identities(user.id, user)
+            if identity.provider in providers
+        )
+        await session.flush()
+
+    async def _find_one(
+        self, session: AsyncSession, stmt: Any, read_replica: bool = True
+    ) -> UserDTO:
+        # Lookups may be served by the read replica, see RoutingSession.
+        result = await session.execute(
+            stmt.execution_options(read_replica=read_replica)
+        )
         return result.scalar_one()
 
-    async def _find_by_id(self, session: AsyncSession, id: int) -> UserDTO:
+    async def _find_by_id(
+        self, session: AsyncSession, id: int, read_replica: bool = True
+    ) -> UserDTO:
         stmt = select(UserDTO).where(UserDTO.id == id)
         try:
-            return await self._find_one(session, stmt)
+            return await self._find_one(session, stmt, read_replica)
         except NoResultFound:
             return None
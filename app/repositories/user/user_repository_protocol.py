@@ -1,16 +1,22 @@
-from typing import Optional, Protocol
+from typing import Any, Iterable, Optional, Protocol, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.entities.user.user_auth_projection import ProjectionT
 from app.core.entities.user.user_entity import UserEntity
 
 
 class UserRepositoryProtocol(Protocol):
     async def find_by_id(
-        self, session: AsyncSession, id: int
+        self, session: AsyncSession, id: int, read_replica: bool = True
     ) -> Optional[UserEntity]:
         ...  # pragma: no cover
 
+    async def find_projection_by_id(
+        self, session: AsyncSession, id: int, projection: Type[ProjectionT]
+    ) -> Optional[ProjectionT]:
+        ...  # pragma: no cover
+
     async def find_by_email(
         self, session: AsyncSession, email: str
     ) -> Optional[UserEntity]:
@@ -31,17 +37,30 @@ class UserRepositoryProtocol(Protocol):
     ) -> Optional[UserEntity]:
         ...  # pragma: no cover
 
+    async def find_by_social_id(
+        self, session: AsyncSession, provider: str, provider_uid: str
+    ) -> Optional[UserEntity]:
+        ...  # pragma: no cover
+
     async def find_by_user_code(
         self, session: AsyncSession, user_code: str
     ) -> Optional[UserEntity]:
         ...  # pragma: no cover
 
+    async def find_tombstone(
+        self, session: AsyncSession, key: str, value: Any
+    ) -> Optional[UserEntity]:
+        ...  # pragma: no cover
+
     async def create(
         self, session: AsyncSession, user: UserEntity
     ) -> UserEntity:
         ...  # pragma: no cover
 
     async def update(
-        self, session: AsyncSession, user: UserEntity
+        self,
+        session: AsyncSession,
+        user: UserEntity,
+        fields: Iterable[str],
     ) -> UserEntity:
         ...  # pragma: no cover
@@ -6,12 +6,18 @@ import app.core.exceptions.user.user_exceptions as exception
 from app.config.config import AppEnv, Config
 from app.core.database import get_db
 from app.core.redis.redis import get_redis
+from app.core.redis.user_session_repository import UserSessionRepository
 from app.core.redis.verify_token_repository import VerifyTokenRepository
 from app.core.schema.auth.auth_schema import BearerResponse, UserLogin
 from app.core.schema.base_response import BaseResponse
 from app.core.schema.common_schemas import LoginType
-from app.core.schema.error_schema import Error, ErrorCode
-from app.dependencies import check_client_credential
+from app.core.schema.error_schema import ErrorCode
+from app.dependencies import check_client_credential, user_repository
+from app.helpers.password_service import (
+    PasswordServiceBusy,
+    PasswordServiceProtocol,
+    get_password_service,
+)
 from app.infra.email.email_client import (
     EmailClient,
     LoggingEmailClient,
@@ -23,13 +29,9 @@ from app.infra.facebook.facebook_client import (
 )
 from app.infra.google.google_client import GoogleClient, GoogleClientProtocol
 from app.infra.sms.sms_client import LoggingSMSClient, MediaSMSClient, SMSClient
-from app.repositories.session.user_session_repository import (
-    UserSessionRepository,
-)
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
 )
-from app.repositories.user.user_repository import UserRepository
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
 )
@@ -48,10 +50,6 @@ log = Log("Auth Route")
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
-
-
 def user_session_repository(
     redis: redis.asyncio.Redis = Depends(get_redis),
 ) -> UserSessionRepositoryProtocol:
@@ -64,11 +62,15 @@ def login_usecase(
         user_session_repository
     ),
     session: Session = Depends(get_db),
+    password_service: PasswordServiceProtocol = Depends(
+        get_password_service
+    ),
 ) -> LoginUseCase:
     return LoginInteractor(
         user_repository=user_repository,
         user_session_repository=user_session_repository,
         session=session,
+        password_service=password_service,
     )
 
 
@@ -100,6 +102,9 @@ def sms_client() -> SMSClient:
 
 def user_create_usecase(
     session: Session = Depends(get_db),
+    password_service: PasswordServiceProtocol = Depends(
+        get_password_service
+    ),
     user_repository: UserRepositoryProtocol = Depends(user_repository),
     verify_token_repository: VerifyTokenRepositoryProtocol = Depends(
         verify_token_repository
@@ -112,6 +117,7 @@ def user_create_usecase(
     return UserRegisterInteractor(
         user_repository=user_repository,
         session=session,
+        password_service=password_service,
         verify_token_repository=verify_token_repository,
         email_client=email_client,
         sms_client=sms_client,
@@ -174,37 +180,34 @@ async def login(
         )
 
     except exception.InvalidFacebookIdOrToken:
-        return BaseResponse.failed(
-            Error(ErrorCode.INVALID_FACEBOOK_ID_OR_TOKEN)
-        )
+        return BaseResponse.failed(ErrorCode.INVALID_FACEBOOK_ID_OR_TOKEN)
 
     except exception.RequiredFacebookId:
-        return BaseResponse.failed(Error(ErrorCode.REQUIRED_FACEBOOK_ID))
+        return BaseResponse.failed(ErrorCode.REQUIRED_FACEBOOK_ID)
 
     except exception.RequiredFacebookAccessToken:
-        return BaseResponse.failed(
-            Error(ErrorCode.REQUIRED_FACEBOOK_ACCESS_TOKEN)
-        )
+        return BaseResponse.failed(ErrorCode.REQUIRED_FACEBOOK_ACCESS_TOKEN)
 
     except exception.InvalidGoogleIdOrToken:
-        return BaseResponse.failed(Error(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN))
+        return BaseResponse.failed(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN)
 
     except exception.RequiredGoogleId:
-        return BaseResponse.failed(Error(ErrorCode.REQUIRED_GOOGLE_ID))
+        return BaseResponse.failed(ErrorCode.REQUIRED_GOOGLE_ID)
 
     except exception.RequiredGoogleAccessToken:
-        return BaseResponse.failed(
-            Error(ErrorCode.REQUIRED_GOOGLE_ACCESS_TOKEN)
-        )
+        return BaseResponse.failed(ErrorCode.REQUIRED_GOOGLE_ACCESS_TOKEN)
 
     except exception.UserNotExists:
-        return BaseResponse.failed(Error(ErrorCode.USER_NOT_EXISTS))
+        return BaseResponse.failed(ErrorCode.USER_NOT_EXISTS)
 
     except exception.InvalidPassword:
-        return BaseResponse.failed(Error(ErrorCode.INVALID_PASSWORD))
+        return BaseResponse.failed(ErrorCode.INVALID_PASSWORD)
 
     except exception.UserDeleted:
-        return BaseResponse.failed(Error(ErrorCode.USER_DELETED))
+        return BaseResponse.failed(ErrorCode.USER_DELETED)
+
+    except PasswordServiceBusy:
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
 
     except Exception:
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
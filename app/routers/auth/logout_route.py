@@ -1,21 +1,16 @@
 import redis.asyncio
 from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.entities.auth.auth_context_entity import AuthContextEntity
 from app.core.redis.redis import get_redis
 from app.core.redis.user_session_repository import UserSessionRepository
 from app.core.schema.base_response import BaseResponse
-from app.core.schema.error_schema import Error, ErrorCode
-from app.dependencies import get_current_user
+from app.core.schema.error_schema import ErrorCode
+from app.dependencies import authenticate
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
 )
-from app.repositories.user.user_repository import UserRepository
-from app.repositories.user.user_repository_protocol import (
-    UserRepositoryProtocol,
-)
 from app.usecases.auth.logout.logout_usecase import (
     LogoutInteractor,
     LogoutUseCase,
@@ -24,14 +19,10 @@ from app.usecases.auth.logout.logout_usecase import (
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 router = APIRouter(
-    prefix="/auth", tags=["auth"], dependencies=[Depends(get_current_user)]
+    prefix="/auth", tags=["auth"], dependencies=[Depends(authenticate)]
 )
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
-
-
 def user_session_repository(
     redis: redis.asyncio.Redis = Depends(get_redis),
 ) -> UserSessionRepositoryProtocol:
@@ -39,17 +30,11 @@ def user_session_repository(
 
 
 def logout_usecase(
-    user_repository: UserRepositoryProtocol = Depends(user_repository),
     user_session_repository: UserSessionRepositoryProtocol = Depends(
         user_session_repository
     ),
-    session: Session = Depends(get_db),
 ) -> LogoutUseCase:
-    return LogoutInteractor(
-        user_repository=user_repository,
-        user_session_repository=user_session_repository,
-        session=session,
-    )
+    return LogoutInteractor(user_session_repository=user_session_repository)
 
 
 @router.post(
@@ -58,21 +43,55 @@ def logout_usecase(
     status_code=status.HTTP_200_OK,
 )
 async def signout(
-    token: str = Depends(oauth2_scheme),
+    auth_context: AuthContextEntity = Depends(authenticate),
     logout_usecase: LogoutUseCase = Depends(logout_usecase),
 ):
     """
     Logout.
 
     Parameters:
-        token (str): The authentication token.
+        auth_context (AuthContextEntity): The resolved authentication context.
+        logout_usecase (LogoutUseCase): The logout use case.
+
+    Returns:
+        BaseResponse: The response indicating the success or failure of the logout process.
+    """
+    # A failed authentication is returned as is.
+    if not isinstance(auth_context, AuthContextEntity):
+        return auth_context
+    try:
+        await logout_usecase.logout(
+            token=auth_context.token, claims=auth_context.claims
+        )
+        return BaseResponse.success()
+    except Exception:
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
+
+
+@router.post(
+    "/logout-all",
+    summary="Logout from all devices",
+    status_code=status.HTTP_200_OK,
+)
+async def signout_all(
+    auth_context: AuthContextEntity = Depends(authenticate),
+    logout_usecase: LogoutUseCase = Depends(logout_usecase),
+):
+    """
+    Logout from every device by revoking all sessions of the user.
+
+    Parameters:
+        auth_context (AuthContextEntity): The resolved authentication context.
         logout_usecase (LogoutUseCase): The logout use case.
 
     Returns:
         BaseResponse: The response indicating the success or failure of the logout process.
     """
+    # A failed authentication is returned as is.
+    if not isinstance(auth_context, AuthContextEntity):
+        return auth_context
     try:
-        await logout_usecase.logout(token=token)
+        await logout_usecase.logout_all(user_id=auth_context.user_id)
         return BaseResponse.success()
     except Exception:
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
@@ -8,14 +8,19 @@ from app.core.database import get_db
 from app.core.redis.redis import get_redis
 from app.core.redis.verify_token_repository import VerifyTokenRepository
 from app.core.schema.base_response import BaseResponse
-from app.core.schema.error_schema import Error, ErrorCode
+from app.core.schema.error_schema import ErrorCode
 from app.core.schema.user.user_schema import (
     UserEmailCreate,
     UserFacebookCreate,
     UserGoogleCreate,
     UserPhoneCreate,
 )
-from app.dependencies import check_client_credential
+from app.dependencies import check_client_credential, user_repository
+from app.helpers.password_service import (
+    PasswordServiceBusy,
+    PasswordServiceProtocol,
+    get_password_service,
+)
 from app.infra.email.email_client import (
     EmailClient,
     LoggingEmailClient,
@@ -27,7 +32,6 @@ from app.infra.facebook.facebook_client import (
 )
 from app.infra.google.google_client import GoogleClient, GoogleClientProtocol
 from app.infra.sms.sms_client import LoggingSMSClient, MediaSMSClient, SMSClient
-from app.repositories.user.user_repository import UserRepository
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
 )
@@ -45,10 +49,6 @@ log = Log("Register Route")
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
-
-
 def verify_token_repository(
     redis: redis.asyncio.Redis = Depends(get_redis),
 ) -> VerifyTokenRepositoryProtocol:
@@ -77,6 +77,9 @@ def facebook_client() -> FacebookClientProtocol:
 
 def user_create_usecase(
     session: Session = Depends(get_db),
+    password_service: PasswordServiceProtocol = Depends(
+        get_password_service
+    ),
     user_repository: UserRepositoryProtocol = Depends(user_repository),
     verify_token_repository: VerifyTokenRepositoryProtocol = Depends(
         verify_token_repository
@@ -89,6 +92,7 @@ def user_create_usecase(
     return UserRegisterInteractor(
         user_repository=user_repository,
         session=session,
+        password_service=password_service,
         verify_token_repository=verify_token_repository,
         email_client=email_client,
         sms_client=sms_client,
@@ -113,14 +117,17 @@ async def register_by_email(
         return BaseResponse.success()
 
     except exception.EmailHasNotBeenVerified:
-        return BaseResponse.failed(Error(ErrorCode.NOT_VERIFIED))
+        return BaseResponse.failed(ErrorCode.NOT_VERIFIED)
 
     except exception.EmailAlreadyExists:
-        return BaseResponse.failed(Error(ErrorCode.EMAIL_ALREADY_EXISTS))
+        return BaseResponse.failed(ErrorCode.EMAIL_ALREADY_EXISTS)
+
+    except PasswordServiceBusy:
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
 
     except Exception:
         log.exception("error occured while creating a user.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -138,14 +145,17 @@ async def register_by_phone(
         return BaseResponse.success()
 
     except exception.PhoneHasNotBeenVerified:
-        return BaseResponse.failed(Error(ErrorCode.NOT_VERIFIED))
+        return BaseResponse.failed(ErrorCode.NOT_VERIFIED)
 
     except exception.PhoneAlreadyExists:
-        return BaseResponse.failed(Error(ErrorCode.PHONE_ALREADY_EXISTS))
+        return BaseResponse.failed(ErrorCode.PHONE_ALREADY_EXISTS)
+
+    except PasswordServiceBusy:
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
 
     except Exception:
         log.exception("Error occured while creating a user.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -163,18 +173,14 @@ async def register_by_facebook(
         return BaseResponse.success()
 
     except exception.FacebookAccountAlreadyExists:
-        return BaseResponse.failed(
-            Error(ErrorCode.ALREADY_EXISTS_FACEBOOK_ACCOUNT)
-        )
+        return BaseResponse.failed(ErrorCode.ALREADY_EXISTS_FACEBOOK_ACCOUNT)
 
     except exception.InvalidFacebookIdOrToken:
-        return BaseResponse.failed(
-            Error(ErrorCode.INVALID_FACEBOOK_ID_OR_TOKEN)
-        )
+        return BaseResponse.failed(ErrorCode.INVALID_FACEBOOK_ID_OR_TOKEN)
 
     except Exception:
         log.exception("Error occured while creating a user.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -192,16 +198,14 @@ async def register_by_google(
         return BaseResponse.success()
 
     except exception.GoogleAccountAlreadyExists:
-        return BaseResponse.failed(
-            Error(ErrorCode.ALREADY_EXISTS_GOOGLE_ACCOUNT)
-        )
+        return BaseResponse.failed(ErrorCode.ALREADY_EXISTS_GOOGLE_ACCOUNT)
 
     except exception.InvalidGoogleAccessToken:
-        return BaseResponse.failed(Error(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN))
+        return BaseResponse.failed(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN)
 
     except exception.InvalidGoogleIdOrToken:
-        return BaseResponse.failed(Error(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN))
+        return BaseResponse.failed(ErrorCode.INVALID_GOOGLE_ID_OR_TOKEN)
 
     except Exception:
         log.exception("Error occured while creating a user.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
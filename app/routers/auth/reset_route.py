@@ -8,22 +8,30 @@ from app.config.config import AppEnv, Config
 from app.core.database import get_db
 from app.core.redis.redis import get_redis
 from app.core.redis.reset_repository import ResetRepository
+from app.core.redis.user_session_repository import UserSessionRepository
 from app.core.schema.auth.auth_schema import (
     ForgotPasswordEmail,
     ForgotPasswordPhone,
     ResetPassword,
 )
 from app.core.schema.base_response import BaseResponse
-from app.core.schema.error_schema import Error, ErrorCode
-from app.dependencies import check_client_credential
+from app.core.schema.error_schema import ErrorCode
+from app.dependencies import check_client_credential, user_repository
+from app.helpers.password_service import (
+    PasswordServiceBusy,
+    PasswordServiceProtocol,
+    get_password_service,
+)
 from app.infra.email.email_client import (
     EmailClient,
     LoggingEmailClient,
     SESClient,
 )
 from app.infra.sms.sms_client import LoggingSMSClient, MediaSMSClient, SMSClient
+from app.repositories.session.user_session_repository_protocol import (
+    UserSessionRepositoryProtocol,
+)
 from app.repositories.user.reset_repository import ResetRepositoryProtocol
-from app.repositories.user.user_repository import UserRepository
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
 )
@@ -32,16 +40,18 @@ from app.usecases.auth.reset.reset_usecase import ResetInteractor, ResetUseCase
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
-
-
 def reset_repository(
     redis: redis.asyncio.Redis = Depends(get_redis),
 ) -> ResetRepositoryProtocol:
     return ResetRepository(redis=redis)
 
 
+def user_session_repository(
+    redis: redis.asyncio.Redis = Depends(get_redis),
+) -> UserSessionRepositoryProtocol:
+    return UserSessionRepository(redis=redis)
+
+
 def email_client() -> EmailClient:
     if Config.APP_ENV == AppEnv.local:
         return LoggingEmailClient()
@@ -56,15 +66,23 @@ def sms_client() -> SMSClient:
 
 def reset_usecase(
     session: Session = Depends(get_db),
+    password_service: PasswordServiceProtocol = Depends(
+        get_password_service
+    ),
     user_repository: UserRepositoryProtocol = Depends(user_repository),
     reset_repository: ResetRepositoryProtocol = Depends(reset_repository),
+    user_session_repository: UserSessionRepositoryProtocol = Depends(
+        user_session_repository
+    ),
     email_client: EmailClient = Depends(email_client),
     sms_client: SMSClient = Depends(sms_client),
 ) -> ResetUseCase:
     return ResetInteractor(
         user_repository=user_repository,
         session=session,
+        password_service=password_service,
         reset_repository=reset_repository,
+        user_session_repository=user_session_repository,
         email_client=email_client,
         sms_client=sms_client,
     )
@@ -84,11 +102,11 @@ async def forgot_password_by_email(
         await reset_usecase.reset_by_email(form_data)
         return BaseResponse.success()
     except exception.UserNotExists:
-        return BaseResponse.failed(Error(ErrorCode.USER_NOT_EXISTS))
+        return BaseResponse.failed(ErrorCode.USER_NOT_EXISTS)
 
     except Exception:
         logger.exception("Error happened when resetting password by email.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -105,11 +123,11 @@ async def forgot_password_by_phone(
         await reset_usecase.reset_by_phone(form_data)
         return BaseResponse.success()
     except exception.UserNotExists:
-        return BaseResponse.failed(Error(ErrorCode.USER_NOT_EXISTS))
+        return BaseResponse.failed(ErrorCode.USER_NOT_EXISTS)
 
     except Exception:
         logger.exception("Error happened when resetting password by phone.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -124,11 +142,14 @@ async def reset_password(
         await reset_usecase.reset(data)
         return BaseResponse.success()
     except exception.UserNotExists:
-        return BaseResponse.failed(Error(ErrorCode.USER_NOT_EXISTS))
+        return BaseResponse.failed(ErrorCode.USER_NOT_EXISTS)
 
     except exception.InvalidResetToken:
-        return BaseResponse.failed(Error(ErrorCode.BAD_TOKEN))
+        return BaseResponse.failed(ErrorCode.BAD_TOKEN)
+
+    except PasswordServiceBusy:
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
 
     except Exception:
         logger.exception("Error happened when resetting password.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
@@ -7,9 +7,10 @@ from sqlalchemy.orm import Session
 import app.core.exceptions.user.user_exceptions as exceptions
 from app.config.config import AppEnv, Config
 from app.core.database import get_db
-from app.core.entities.user.user_entity import UserEntity
+from app.core.entities.user.user_auth_projection import UserAuthProjection
 from app.core.redis.redis import get_redis
 from app.core.redis.refresh_count_repository import RefreshCountRepository
+from app.core.redis.user_session_repository import UserSessionRepository
 from app.core.redis.verify_token_repository import VerifyTokenRepository
 from app.core.schema.auth.auth_schema import (
     BearerResponse,
@@ -17,24 +18,20 @@ from app.core.schema.auth.auth_schema import (
     VerifyPhone,
 )
 from app.core.schema.base_response import BaseResponse
-from app.core.schema.error_schema import Error, ErrorCode
-from app.dependencies import get_current_user
+from app.core.schema.error_schema import ErrorCode
+from app.dependencies import get_current_user, user_repository
 from app.infra.email.email_client import (
     EmailClient,
     LoggingEmailClient,
     SESClient,
 )
 from app.infra.sms.sms_client import LoggingSMSClient, MediaSMSClient, SMSClient
-from app.repositories.session.user_session_repository import (
-    UserSessionRepository,
-)
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
 )
 from app.repositories.user.refresh_count_repository import (
     RefreshCountRepositoryProtocol,
 )
-from app.repositories.user.user_repository import UserRepository
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
 )
@@ -51,10 +48,6 @@ router = APIRouter(prefix="/auth/verify", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def user_repository() -> UserRepositoryProtocol:
-    return UserRepository()
-
-
 def verify_user_repository(
     redis: redis.asyncio.Redis = Depends(get_redis),
 ) -> VerifyTokenRepositoryProtocol:
@@ -133,12 +126,12 @@ async def verify_email(
         )
 
     except exceptions.UserAlreadyVerified:
-        return BaseResponse.failed(Error(ErrorCode.ALREADY_VERIFIED))
+        return BaseResponse.failed(ErrorCode.ALREADY_VERIFIED)
     except (exceptions.InvalidVerifyToken, exceptions.UserNotExists):
-        return BaseResponse.failed(Error(ErrorCode.BAD_TOKEN))
+        return BaseResponse.failed(ErrorCode.BAD_TOKEN)
     except Exception:
         logger.exception("error occured while verify user email.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -147,7 +140,7 @@ async def verify_email(
     status_code=status.HTTP_200_OK,
 )
 async def refresh_email_verify_token(
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: UserAuthProjection = Depends(get_current_user),
     user_verify_usecase: UserVerifyUseCase = Depends(user_verify_usecase),
 ):
     try:
@@ -155,12 +148,12 @@ async def refresh_email_verify_token(
         return BaseResponse.success()
 
     except exceptions.UserAlreadyVerified:
-        return BaseResponse.failed(Error(ErrorCode.ALREADY_VERIFIED))
+        return BaseResponse.failed(ErrorCode.ALREADY_VERIFIED)
     except exceptions.RefreshCountLimitExceeded:
-        return BaseResponse.failed(Error(ErrorCode.TOO_MANY_REQUESTS))
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
     except Exception:
         logger.exception("error occured while refreshing verify token.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -184,12 +177,12 @@ async def verify_phone(
         )
 
     except exceptions.UserAlreadyVerified:
-        return BaseResponse.failed(Error(ErrorCode.ALREADY_VERIFIED))
+        return BaseResponse.failed(ErrorCode.ALREADY_VERIFIED)
     except (exceptions.InvalidVerifyToken, exceptions.UserNotExists):
-        return BaseResponse.failed(Error(ErrorCode.BAD_TOKEN))
+        return BaseResponse.failed(ErrorCode.BAD_TOKEN)
     except Exception:
         logger.exception("error occured while verify user.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
 
 
 @router.post(
@@ -198,18 +191,18 @@ async def verify_phone(
     status_code=status.HTTP_200_OK,
 )
 async def refresh_phone_verify_token(
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: UserAuthProjection = Depends(get_current_user),
     user_verify_usecase: UserVerifyUseCase = Depends(user_verify_usecase),
 ):
     try:
         await user_verify_usecase.refresh_phone_verify_token(current_user)
         return BaseResponse.success()
     except exceptions.UserAlreadyVerified:
-        return BaseResponse.failed(Error(ErrorCode.ALREADY_VERIFIED))
+        return BaseResponse.failed(ErrorCode.ALREADY_VERIFIED)
 
     except exceptions.RefreshCountLimitExceeded:
-        return BaseResponse.failed(Error(ErrorCode.TOO_MANY_REQUESTS))
+        return BaseResponse.failed(ErrorCode.TOO_MANY_REQUESTS)
 
     except Exception:
         logger.exception("error occured while refreshing verify token.")
-        return BaseResponse.failed(Error(ErrorCode.INTERNAL_SERVER_ERROR))
+        return BaseResponse.failed(ErrorCode.INTERNAL_SERVER_ERROR)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from youtube_transcript_api import YouTubeTranscriptApi
 
@@ -11,10 +12,13 @@ router = APIRouter(prefix="/testing")
 @router.get(
     "/videoId",
 )
-def get_video_id():
+async def get_video_id():
     youtubeID = "7bCIHLgKJnU"
 
-    srt = YouTubeTranscriptApi.get_transcript(youtubeID)
+    # The transcript API is blocking, keep it off the event loop.
+    srt = await run_in_threadpool(
+        YouTubeTranscriptApi.get_transcript, youtubeID
+    )
 
     # for item in srt:
     #     item["vi_translation"] = translate_en2vi(item["text"])
@@ -24,10 +28,10 @@ def get_video_id():
     #     "srt": srt,
     # }
     # return json_response({**SuccessResponse.default(), "data": srt})
-    return BaseResponse.success(
-            srt,
-            msg="Get video successfully",
-        )
+    return BaseResponse.stream(
+        srt,
+        msg="Get video successfully",
+    )
 
 
 # @router.get(
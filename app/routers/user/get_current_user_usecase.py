@@ -3,7 +3,8 @@ from typing import Optional, Protocol
 from sqlalchemy.orm import Session
 
 from app.config.config import Config
-from app.core.entities.user.user_entity import UserEntity
+from app.core.entities.auth.auth_context_entity import AuthContextEntity
+from app.core.entities.user.user_auth_projection import UserAuthProjection
 from app.helpers import jwt
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
@@ -14,7 +15,12 @@ from app.repositories.user.user_repository_protocol import (
 
 
 class GetCurrentUserUseCase(Protocol):
-    async def get_current_user(self, token: str) -> Optional[UserEntity]:
+    async def resolve_auth(self, token: str) -> Optional[AuthContextEntity]:
+        ...  # pragma: no cover
+
+    async def get_current_user(
+        self, token: str
+    ) -> Optional[UserAuthProjection]:
         ...  # pragma: no cover
 
 
@@ -29,19 +35,37 @@ class GetCurrentUserInteractor(GetCurrentUserUseCase):
         self.user_session_repository = user_session_repository
         self.session = session
 
-    async def get_current_user(self, token: str) -> Optional[UserEntity]:
-        user_id = await self.user_session_repository.read_token(token)
-        if not user_id:
-            return None
+    async def resolve_auth(self, token: str) -> Optional[AuthContextEntity]:
+        """
+        Resolve token -> claims -> session -> user exactly once.
+
+        The claims are decoded before touching Redis so that malformed or
+        expired tokens are rejected without a round-trip.
+        """
         try:
-            payload = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
-            user_id_from_token = int(payload.get("user_id"))
+            claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+            user_id_from_token = int(claims.get("user_id"))
         except Exception:
             return None
-        if user_id_from_token != user_id:
+
+        user_id = await self.user_session_repository.read_token(
+            token, claims
+        )
+        if not user_id or user_id != user_id_from_token:
             return None
-        user = await self.user_repository.find_by_id(self.session, user_id)
+
+        # Only the columns needed to authenticate are loaded here.
+        user = await self.user_repository.find_projection_by_id(
+            self.session, user_id, UserAuthProjection
+        )
         if not user:
             return None
-        else:
-            return user
+        return AuthContextEntity(token=token, claims=claims, user=user)
+
+    async def get_current_user(
+        self, token: str
+    ) -> Optional[UserAuthProjection]:
+        auth_context = await self.resolve_auth(token)
+        if not auth_context:
+            return None
+        return auth_context.user
@@ -1,5 +1,6 @@
 from typing import Any, Callable, Coroutine, Optional, Protocol, Tuple
 
+from loguru import logger
 from pydantic import SecretStr
 from sqlalchemy.orm import Session
 
@@ -11,7 +12,7 @@ from app.core.schema.auth.auth_schema import (
     UserLogin,
 )
 from app.core.schema.common_schemas import LoginType
-from app.helpers.password import PasswordHelper
+from app.helpers.password_service import PasswordServiceProtocol
 from app.repositories.session.user_session_repository_protocol import (
     UserSessionRepositoryProtocol,
 )
@@ -41,10 +42,12 @@ class LoginInteractor(LoginUseCase):
         user_repository: UserRepositoryProtocol,
         user_session_repository: UserSessionRepositoryProtocol,
         session: Session,
+        password_service: PasswordServiceProtocol,
     ):
         self.user_repository = user_repository
         self.user_session_repository = user_session_repository
         self.session = session
+        self.password_service = password_service
 
     async def login(self, credentials: UserLogin) -> tuple[str, bool]:
         # Determine whether it's an email address or a phone number
@@ -65,23 +68,31 @@ class LoginInteractor(LoginUseCase):
         if credentials.email:
             callable = self.user_repository.find_by_email
             login_type = LoginType.EMAIL
-            user = await callable(self.session, credentials.email)
+            key, value = "email", credentials.email
         else:
             callable = self.user_repository.find_by_phone
-            user = await callable(
-                self.session,
+            key, value = "phone", (
                 credentials.phone.get_secret_value()
                 if isinstance(credentials.phone, SecretStr)
-                else credentials.phone,
+                else credentials.phone
+            )
+        user = await callable(self.session, value)
+        # Archived users are still reported as deleted.
+        if not user:
+            user = await self.user_repository.find_tombstone(
+                self.session, key, value
             )
 
         # If user is not logged in raise exception. UserNotExists
         if not user:
             # Timing attack prevention https://code.djangoproject.com/ticket/20760
-            PasswordHelper().hash(credentials.password)
+            await self.password_service.hash(credentials.password)
             raise exception.UserNotExists
 
-        verified = PasswordHelper().verify(
+        (
+            verified,
+            updated_hash,
+        ) = await self.password_service.verify_and_update(
             plain_password=credentials.password,
             hashed_password=user.hashed_password,
         )
@@ -93,6 +104,10 @@ class LoginInteractor(LoginUseCase):
         if user.deleted_at:
             raise exception.UserDeleted
 
+        # Upgrade hashes made with an outdated scheme or cost.
+        if updated_hash:
+            user = await self._rehash_password(user, updated_hash)
+
         is_user_verified: bool = False
         # Check if the user is verified.
         if (login_type == LoginType.EMAIL and user.is_email_verified) or (
@@ -106,6 +121,26 @@ class LoginInteractor(LoginUseCase):
 
         return token, is_user_verified
 
+    async def _rehash_password(
+        self, user: UserEntity, hashed_password: str
+    ) -> UserEntity:
+        user.hashed_password = hashed_password
+        try:
+            return await self.user_repository.update(
+                self.session, user, fields=["hashed_password"]
+            )
+        except Exception as e:
+            # Skipping as the old hash still verifies, retried on next login
+            logger.warning(f"Failed to rehash password: {e}")
+            return user
+
+    async def _raise_if_archived(self, key: str, value: str) -> None:
+        user = await self.user_repository.find_tombstone(
+            self.session, key, value
+        )
+        if user:
+            raise exception.UserDeleted
+
     async def login_facebook(
         self, credentials: UserFacebookLogin
     ) -> tuple[str, bool]:
@@ -124,6 +159,9 @@ class LoginInteractor(LoginUseCase):
         user = await callable(self.session, credentials.facebook_id)
 
         if not user:
+            await self._raise_if_archived(
+                "facebook_id", credentials.facebook_id
+            )
             # Timing attack prevention https://code.djangoproject.com/ticket/20760
             raise exception.UserNotExists
 
@@ -157,6 +195,7 @@ class LoginInteractor(LoginUseCase):
         user = await callable(self.session, credentials.google_id)
 
         if not user:
+            await self._raise_if_archived("google_id", credentials.google_id)
             # Timing attack prevention https://code.djangoproject.com/ticket/20760
             raise exception.UserNotExists
 
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Type
 
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -14,7 +14,7 @@ from app.core.schema.user.user_schema import (
     UserPhoneCreate,
     UserRead,
 )
-from app.helpers.password import PasswordHelper
+from app.helpers.password_service import PasswordServiceProtocol
 from app.infra.email.email_client import EmailClient
 from app.infra.facebook.facebook_client import FacebookClient
 from app.infra.google.google_client import GoogleClient
@@ -54,6 +54,7 @@ class UserRegisterInteractor(UserRegisterUseCase):
     def __init__(
         self,
         session: Session,
+        password_service: PasswordServiceProtocol,
         user_repository: UserRepositoryProtocol,
         verify_token_repository: VerifyTokenRepositoryProtocol,
         email_client: EmailClient,
@@ -62,6 +63,7 @@ class UserRegisterInteractor(UserRegisterUseCase):
         google_client: GoogleClient,
     ):
         self.session = session
+        self.password_service = password_service
         self.user_repository = user_repository
         self.verify_token_repository = verify_token_repository
         self.email_client = email_client
@@ -75,20 +77,28 @@ class UserRegisterInteractor(UserRegisterUseCase):
         user = await self.user_repository.find_by_email(
             self.session, user_email_create.email
         )
+        if not user:
+            await self._raise_if_archived(
+                "email", user_email_create.email, exception.EmailAlreadyExists
+            )
         # If the user is a valid email address.
         if user:
             if not user.is_email_verified:
                 raise exception.EmailHasNotBeenVerified
             raise exception.EmailAlreadyExists
 
-        hashed_password = PasswordHelper().hash(user_email_create.password)
+        hashed_password = await self.password_service.hash(
+            user_email_create.password
+        )
         try:
             self.session.begin()
             # Update the user s hashed_password.
             if user:
                 user.hashed_password = hashed_password
                 try:
-                    user = await self.user_repository.update(self.session, user)
+                    user = await self.user_repository.update(
+                        self.session, user, fields=["hashed_password"]
+                    )
                 except exception.UserNotExists:
                     user = None
             # Create or update a user.
@@ -103,8 +113,6 @@ class UserRegisterInteractor(UserRegisterUseCase):
                     is_google_verified=False,
                 )
                 user = await self.user_repository.create(self.session, user)
-                user.generate_user_code_if_empty()
-                user = await self.user_repository.update(self.session, user)
 
             token = await self.verify_token_repository.write_email_token(user)
             self.email_client.send_email(
@@ -127,20 +135,30 @@ class UserRegisterInteractor(UserRegisterUseCase):
         user = await self.user_repository.find_by_phone(
             self.session, str(user_phone_create.phone)
         )
+        if not user:
+            await self._raise_if_archived(
+                "phone",
+                str(user_phone_create.phone),
+                exception.PhoneAlreadyExists,
+            )
         # If the user is a phone.
         if user:
             if not user.is_phone_verified:
                 raise exception.PhoneHasNotBeenVerified
             raise exception.PhoneAlreadyExists
 
-        hashed_password = PasswordHelper().hash(user_phone_create.password)
+        hashed_password = await self.password_service.hash(
+            user_phone_create.password
+        )
         try:
             self.session.begin()
             # Update the user s hashed_password.
             if user:
                 user.hashed_password = hashed_password
                 try:
-                    user = await self.user_repository.update(self.session, user)
+                    user = await self.user_repository.update(
+                        self.session, user, fields=["hashed_password"]
+                    )
                 except exception.UserNotExists:
                     user = None
             # Create or update a user.
@@ -155,8 +173,6 @@ class UserRegisterInteractor(UserRegisterUseCase):
                     is_google_verified=False,
                 )
                 user = await self.user_repository.create(self.session, user)
-                user.generate_user_code_if_empty()
-                user = await self.user_repository.update(self.session, user)
             pin = await self.verify_token_repository.write_phone_pin_code(user)
             self.sms_client.send_sms(
                 user_phone_create.phone, MessageTemplate.verify_sms_text(pin)
@@ -174,6 +190,12 @@ class UserRegisterInteractor(UserRegisterUseCase):
         user = await self.user_repository.find_by_facebook_id(
             self.session, str(user_facebook_create.facebook_id)
         )
+        if not user:
+            await self._raise_if_archived(
+                "facebook_id",
+                str(user_facebook_create.facebook_id),
+                exception.FacebookAccountAlreadyExists,
+            )
 
         if user:
             raise exception.FacebookAccountAlreadyExists
@@ -208,8 +230,6 @@ class UserRegisterInteractor(UserRegisterUseCase):
                 )
 
                 user = await self.user_repository.create(self.session, user)
-                user.generate_user_code_if_empty()
-                user = await self.user_repository.update(self.session, user)
             await self.session.commit()
         except Exception as e:
             logger.exception("user creation by google failed.")
@@ -223,6 +243,12 @@ class UserRegisterInteractor(UserRegisterUseCase):
         user = await self.user_repository.find_by_google_id(
             self.session, str(user_google_create.google_id)
         )
+        if not user:
+            await self._raise_if_archived(
+                "google_id",
+                str(user_google_create.google_id),
+                exception.GoogleAccountAlreadyExists,
+            )
 
         if user:
             raise exception.GoogleAccountAlreadyExists
@@ -242,8 +268,8 @@ class UserRegisterInteractor(UserRegisterUseCase):
                     raise exception.InvalidGoogleIdOrToken
 
                 user = UserEntity(
-                    facebook_id=str(user_google_create.google_id),
-                    facebook_access_token=user_google_create.google_access_token,
+                    google_id=str(user_google_create.google_id),
+                    google_access_token=user_google_create.google_access_token,
                     sex_code=SexEntity.CODE_NOT_KNOWN,
                     hashed_password="",
                     is_email_verified=False,
@@ -253,11 +279,19 @@ class UserRegisterInteractor(UserRegisterUseCase):
                 )
 
                 user = await self.user_repository.create(self.session, user)
-                user.generate_user_code_if_empty()
-                user = await self.user_repository.update(self.session, user)
             await self.session.commit()
         except Exception as e:
             logger.exception("user creation by google failed.")
             await self.session.rollback()
             raise e
         return UserRead.from_entity(user)
+
+    async def _raise_if_archived(
+        self, key: str, value: str, error: Type[Exception]
+    ) -> None:
+        # The keys of archived users stay taken.
+        user = await self.user_repository.find_tombstone(
+            self.session, key, value
+        )
+        if user:
+            raise error
@@ -10,10 +10,13 @@ from app.core.schema.auth.auth_schema import (
     ForgotPasswordPhone,
     ResetPassword,
 )
-from app.helpers.password import PasswordHelper
+from app.helpers.password_service import PasswordServiceProtocol
 from app.infra.email.email_client import EmailClient
 from app.infra.sms.sms_client import SMSClient
 from app.message_template import MessageTemplate
+from app.repositories.session.user_session_repository_protocol import (
+    UserSessionRepositoryProtocol,
+)
 from app.repositories.user.reset_repository import ResetRepositoryProtocol
 from app.repositories.user.user_repository_protocol import (
     UserRepositoryProtocol,
@@ -35,14 +38,18 @@ class ResetInteractor(ResetUseCase):
     def __init__(
         self,
         session: Session,
+        password_service: PasswordServiceProtocol,
         user_repository: UserRepositoryProtocol,
         reset_repository: ResetRepositoryProtocol,
+        user_session_repository: UserSessionRepositoryProtocol,
         email_client: EmailClient,
         sms_client: SMSClient,
     ):
         self.session = session
+        self.password_service = password_service
         self.user_repository = user_repository
         self.reset_repository = reset_repository
+        self.user_session_repository = user_session_repository
         self.email_client = email_client
         self.sms_client = sms_client
 
@@ -93,9 +100,13 @@ class ResetInteractor(ResetUseCase):
         if not user:
             raise exception.UserNotExists()
 
-        hashed_password = PasswordHelper().hash(
+        hashed_password = await self.password_service.hash(
             reset_info.password.get_secret_value()
         )
         user.hashed_password = hashed_password
-        await self.user_repository.update(self.session, user)
+        await self.user_repository.update(
+            self.session, user, fields=["hashed_password"]
+        )
         await self.reset_repository.destroy_token(reset_info.token)
+        # Sessions opened with the old password must not survive the reset.
+        await self.user_session_repository.destroy_all_tokens(user.id)
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 import app.core.exceptions.user.user_exceptions as exception
 from app.config.config import Config
+from app.core.entities.user.user_auth_projection import UserAuthProjection
 from app.core.entities.user.user_entity import UserEntity
 from app.core.schema.auth.auth_schema import VerifyEmail, VerifyPhone
 from app.core.schema.common_schemas import LoginType
@@ -32,10 +33,14 @@ class UserVerifyUseCase(Protocol):
     async def verify_phone(self, verify_phone: VerifyPhone) -> str:
         ...  # pragma: no cover
 
-    async def refresh_email_verify_token(self, user: UserEntity) -> None:
+    async def refresh_email_verify_token(
+        self, user: UserAuthProjection
+    ) -> None:
         ...  # pragma: no cover
 
-    async def refresh_phone_verify_token(self, user: UserEntity) -> None:
+    async def refresh_phone_verify_token(
+        self, user: UserAuthProjection
+    ) -> None:
         ...  # pragma: no cover
 
 
@@ -78,7 +83,9 @@ class UserVerifyInteractor(UserVerifyUseCase):
             raise exception.UserAlreadyVerified()
 
         user.is_email_verified = True
-        user = await self.user_repository.update(self.session, user)
+        user = await self.user_repository.update(
+            self.session, user, fields=["is_email_verified"]
+        )
         try:
             await self.verify_token_repository.destroy_token(verify_email.token)
         except Exception as e:
@@ -112,7 +119,7 @@ class UserVerifyInteractor(UserVerifyUseCase):
 
         user.is_phone_verified = True
         user = await self.user_repository.update(
-            session=self.session, user=user
+            session=self.session, user=user, fields=["is_phone_verified"]
         )
         try:
             await self.verify_token_repository.destroy_token(verify_phone.pin)
@@ -129,7 +136,7 @@ class UserVerifyInteractor(UserVerifyUseCase):
             user, LoginType.PHONE
         )
 
-    async def refresh_email_verify_token(self, user: UserEntity):
+    async def refresh_email_verify_token(self, user: UserAuthProjection):
         try:
             self.session.begin()
             # If the user is already verified raise exception.
@@ -138,16 +145,16 @@ class UserVerifyInteractor(UserVerifyUseCase):
             if user.is_email_verified:
                 raise exception.UserAlreadyVerified
 
-            count = await self.refresh_count_repository.read_count(user)
+            # Count this refresh and check the limit in a single call.
+            _, exceeded = await self.refresh_count_repository.increment_count(
+                user_entity=user, limit=Config.REFRESH_COUNT_LIMIT
+            )
             # If the count exceeds the limit of the refresh count
-            # limit raise an exception.
-            if count >= Config.REFRESH_COUNT_LIMIT:
+            # limit raise an exception. RefreshCountLimitExceeded exception.
+            if exceeded:
                 raise exception.RefreshCountLimitExceeded
 
             token = await self.verify_token_repository.write_email_token(user)
-            await self.refresh_count_repository.write_count(
-                user_entity=user, count=count + 1
-            )
 
             self.email_client.send_email(
                 sender=Config.MAIL_SENDER,
@@ -162,7 +169,7 @@ class UserVerifyInteractor(UserVerifyUseCase):
             await self.session.rollback()
             raise e
 
-    async def refresh_phone_verify_token(self, user: UserEntity):
+    async def refresh_phone_verify_token(self, user: UserAuthProjection):
         try:
             self.session.begin()
             # If the user is already verified raise exception.
@@ -171,15 +178,16 @@ class UserVerifyInteractor(UserVerifyUseCase):
             if user.is_email_verified:
                 raise exception.UserAlreadyVerified
 
-            count = await self.refresh_count_repository.read_count(user)
+            # Count this refresh and check the limit in a single call.
+            _, exceeded = await self.refresh_count_repository.increment_count(
+                user_entity=user, limit=Config.REFRESH_COUNT_LIMIT
+            )
             # If the count exceeds the limit of the refresh count
             # limit raise an exception. RefreshCountLimitExceeded exception.
-            if count >= Config.REFRESH_COUNT_LIMIT:
+            if exceeded:
                 raise exception.RefreshCountLimitExceeded
+
             pin = await self.verify_token_repository.write_phone_pin_code(user)
-            await self.refresh_count_repository.write_count(
-                user_entity=user, count=count + 1
-            )
             self.sms_client.send_sms(
                 user.phone, MessageTemplate.verify_sms_text(pin)
             )
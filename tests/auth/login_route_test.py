@@ -1,7 +1,14 @@
+from typing import Optional, Tuple
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 
 from app.config.config import Config
+from app.core.schema.error_schema import ErrorCode
+from app.helpers.jwt import decode_jwt
+from app.helpers.password_service import PasswordService, get_password_service
 from app.infra.dto.user.user_dto import UserDTO
 from app.main import journeyLingua
 from tests.conftest import TEST_USER_EMAIL, TEST_USER_PHONE
@@ -40,7 +47,9 @@ async def test_login_by_email(test_create_user, async_client, redis):
         assert response_json["data"]["is_user_verified"] is True
     else:
         assert response_json["data"]["is_user_verified"] is False
-    assert int((await redis.get(f'user_session_token:{response_json["data"]["access_token"]}'))) == user.id
+    claims = decode_jwt(response_json["data"]["access_token"], Config.JWT_TOKEN_SECRET)
+    assert int((await redis.get(f'user_session:{claims["jti"]}'))) == user.id
+    assert claims["jti"] in await redis.smembers(f"user_sessions:{user.id}")
 
 
 @pytest.mark.parametrize(
@@ -74,4 +83,67 @@ async def test_login_by_phone(test_create_user, async_client, redis):
         assert response_json["data"]["is_user_verified"] is True
     else:
         assert response_json["data"]["is_user_verified"] is False
-    assert int((await redis.get(f'user_session_token:{response_json["data"]["access_token"]}'))) == user.id
+    claims = decode_jwt(response_json["data"]["access_token"], Config.JWT_TOKEN_SECRET)
+    assert int((await redis.get(f'user_session:{claims["jti"]}'))) == user.id
+    assert claims["jti"] in await redis.smembers(f"user_sessions:{user.id}")
+
+
+class RehashingPasswordService:
+    async def hash(self, password: str) -> str:
+        return "rehashed-password"
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return True
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return True, "rehashed-password"
+
+
+async def login_by_email(async_client, email: str):
+    return await async_client.post(
+        "/auth/login",
+        json={
+            "email": email,
+            "password": "password",
+            "login_type": 1,
+            "client_id": Config.CLIENT_ID,
+            "client_secret": Config.CLIENT_SECRET,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_login_rejects_when_the_password_service_is_busy(test_create_user, async_client):
+    busy = PasswordService(max_workers=1, max_queue=0)
+    journeyLingua.dependency_overrides[get_password_service] = lambda: busy
+    try:
+        response = await login_by_email(async_client, test_create_user.email)
+    finally:
+        journeyLingua.dependency_overrides.pop(get_password_service)
+
+    assert response.json() == orjson.loads(ErrorCode.TOO_MANY_REQUESTS.body)
+    assert busy.rejected == 1
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_login_stores_the_upgraded_password_hash(test_create_user, async_client, test_session):
+    journeyLingua.dependency_overrides[get_password_service] = RehashingPasswordService
+    try:
+        response = await login_by_email(async_client, test_create_user.email)
+    finally:
+        journeyLingua.dependency_overrides.pop(get_password_service)
+
+    assert response.status_code == 200
+    assert response.json()["data"]["access_token"] is not None
+    stmt = select(UserDTO.hashed_password).where(UserDTO.id == test_create_user.id)
+    assert (await test_session.execute(stmt)).scalar_one() == "rehashed-password"
@@ -0,0 +1,88 @@
+import pytest
+
+from app.config.config import Config
+from app.helpers.jwt import decode_jwt
+from app.infra.dto.user.user_dto import UserDTO
+from tests.conftest import TEST_USER_EMAIL
+
+BAD_TOKEN_RESPONSE = {"code": 400, "msg": "The token is invalid.", "data": None}
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_logout(test_create_user_with_session, async_client, redis):
+    user, token = test_create_user_with_session
+    claims = decode_jwt(token, Config.JWT_TOKEN_SECRET)
+
+    response = await async_client.post("/auth/logout", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.json()["code"] == 200
+    assert await redis.get(f'user_session:{claims["jti"]}') is None
+    assert claims["jti"] not in await redis.smembers(f"user_sessions:{user.id}")
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_logout_all(test_create_user_with_session, async_client, redis):
+    user: UserDTO
+    user, token = test_create_user_with_session
+    # A second device of the same user.
+    response = await async_client.post(
+        "/auth/login",
+        json={
+            "email": user.email,
+            "password": "password",
+            "login_type": 1,
+            "client_id": Config.CLIENT_ID,
+            "client_secret": Config.CLIENT_SECRET,
+        },
+    )
+    other_token = response.json()["data"]["access_token"]
+    session_ids = await redis.smembers(f"user_sessions:{user.id}")
+    assert len(session_ids) == 2
+
+    response = await async_client.post("/auth/logout-all", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.json()["code"] == 200
+    for session_id in session_ids:
+        assert await redis.get(f"user_session:{session_id}") is None
+    assert await redis.smembers(f"user_sessions:{user.id}") == set()
+
+    response = await async_client.post("/auth/logout", headers={"Authorization": f"Bearer {other_token}"})
+
+    assert response.json() == BAD_TOKEN_RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_logout_all_with_bad_token(async_client, redis):
+    response = await async_client.post("/auth/logout-all", headers={"Authorization": "Bearer invalid"})
+
+    assert response.status_code == 200
+    assert response.json() == BAD_TOKEN_RESPONSE
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_logout_all_with_revoked_token(test_create_user_with_session, async_client, redis):
+    user, token = test_create_user_with_session
+    headers = {"Authorization": f"Bearer {token}"}
+    await async_client.post("/auth/logout", headers=headers)
+
+    response = await async_client.post("/auth/logout-all", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == BAD_TOKEN_RESPONSE
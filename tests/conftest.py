@@ -2,7 +2,8 @@ import asyncio
 import uuid
 from copy import deepcopy
 from datetime import datetime
-from typing import AsyncGenerator, Dict, List, Optional, Tuple
+from fnmatch import fnmatch
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 import pytest
 import pytest_asyncio
@@ -17,7 +18,12 @@ from app.config.config import Config
 from app.core.database import Base, get_db
 from app.core.entities.user.sex_entity import SexEntity
 from app.core.redis.redis import get_redis
-from app.core.redis.user_session_repository import UserSessionRepository
+from app.core.redis.refresh_count_repository import INCREMENT_COUNT_SCRIPT
+from app.core.redis.user_session_repository import (
+    DESTROY_ALL_SESSIONS_SCRIPT,
+    STORE_SESSION_SCRIPT,
+    UserSessionRepository,
+)
 from app.core.schema.common_schemas import LoginType
 from app.db.seeds.seeder import Seeder
 from app.infra.dto.user.user_dto import UserDTO
@@ -148,7 +154,7 @@ async def test_create_db(event_loop) -> AsyncGenerator:
 
 
 class RedisMock:
-    store: Dict[str, Tuple[str, Optional[int]]]
+    store: Dict[str, Tuple[Any, Optional[int]]]
 
     def __init__(self):
         self.store = {}
@@ -194,6 +200,114 @@ class RedisMock:
             keys.append(key)
         return keys
 
+    async def expire(self, key: str, seconds: int):
+        value = await self.get(key)
+        if value is None:
+            return False
+        self.store[key] = (value, int(datetime.now().timestamp() + seconds))
+        return True
+
+    async def sadd(self, key: str, *values: str):
+        members = await self.smembers(key)
+        added = len(set(values) - members)
+        _, expiration = self.store.get(key, (None, None))
+        self.store[key] = (members | set(values), expiration)
+        return added
+
+    async def srem(self, key: str, *values: str):
+        members = await self.smembers(key)
+        if not members:
+            return 0
+        removed = len(members & set(values))
+        _, expiration = self.store[key]
+        self.store[key] = (members - set(values), expiration)
+        return removed
+
+    async def smembers(self, key: str) -> Set[str]:
+        return set(await self.get(key) or set())
+
+    async def exists(self, *keys: str) -> int:
+        return len([key for key in keys if await self.get(key) is not None])
+
+    async def ttl(self, key: str) -> int:
+        if await self.get(key) is None:
+            return -2
+        _, expiration = self.store[key]
+        if expiration is None:
+            return -1
+        return int(expiration - datetime.now().timestamp())
+
+    async def scan_iter(self, match: str = "*", count: Optional[int] = None):
+        for key in await self.keys():
+            if fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> "RedisPipelineMock":
+        return RedisPipelineMock(self)
+
+    def register_script(self, script: str) -> "RedisScriptMock":
+        handlers = {
+            DESTROY_ALL_SESSIONS_SCRIPT: self._destroy_all_sessions,
+            STORE_SESSION_SCRIPT: self._store_session,
+            INCREMENT_COUNT_SCRIPT: self._increment_count,
+        }
+        return RedisScriptMock(handlers[script])
+
+    async def _destroy_all_sessions(self, keys: List[str], args: List) -> int:
+        for key in keys[1:]:
+            await self.delete(key)
+        await self.srem(keys[0], *args)
+        if not await self.smembers(keys[0]):
+            await self.delete(keys[0])
+        return len(args)
+
+    async def _store_session(self, keys: List[str], args: List) -> int:
+        user_id, lifetime, session_id, *listed = args
+        await self.set(keys[0], str(user_id), ex=lifetime)
+        pruned = 0
+        for key, member in zip(keys[2:], listed):
+            if not await self.exists(key):
+                pruned += await self.srem(keys[1], member)
+        await self.sadd(keys[1], session_id)
+        if await self.ttl(keys[1]) < lifetime:
+            await self.expire(keys[1], lifetime)
+        return pruned
+
+    async def _increment_count(self, keys: List[str], args: List) -> int:
+        count = int(await self.get(keys[0]) or 0) + 1
+        await self.set(keys[0], str(count), ex=int(args[0]))
+        return count
+
+
+class RedisScriptMock:
+    def __init__(self, handler):
+        self.handler = handler
+
+    async def __call__(
+        self, keys: Optional[List[str]] = None, args: Optional[List] = None
+    ):
+        return await self.handler(keys or [], args or [])
+
+
+class RedisPipelineMock:
+    def __init__(self, redis: RedisMock):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> List:
+        commands, self.commands = self.commands, []
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
 
 @pytest_asyncio.fixture(scope="function")
 def redis() -> RedisMock:
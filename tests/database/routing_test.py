@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import column, create_engine, select, table, update
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.database.routing import ReplicaMonitor, RoutingSession
+
+users = table("users", column("id"))
+
+
+def read_on_replica():
+    return select(users.c.id).execution_options(read_replica=True)
+
+
+def build_monitor(healthy: bool) -> ReplicaMonitor:
+    monitor = ReplicaMonitor(engine=None, max_lag_seconds=5, interval_seconds=1)
+    monitor.healthy = healthy
+    return monitor
+
+
+@pytest.fixture
+def engines():
+    primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def test_marked_reads_go_to_a_healthy_replica(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary, replica_bind=replica, replica_monitor=build_monitor(True))
+
+    assert session.get_bind(clause=read_on_replica()) is replica
+    assert session.get_bind(clause=select(users.c.id)) is primary
+
+
+def test_session_that_has_written_stays_on_the_primary(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary, replica_bind=replica, replica_monitor=build_monitor(True))
+
+    assert session.get_bind(clause=update(users).values(id=1)) is primary
+    assert session.get_bind(clause=read_on_replica()) is primary
+
+
+def test_unhealthy_replica_sends_reads_to_the_primary(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary, replica_bind=replica, replica_monitor=build_monitor(False))
+
+    assert session.get_bind(clause=read_on_replica()) is primary
+
+
+class StatusResult:
+    def __init__(self, row):
+        self.row = row
+
+    def mappings(self):
+        return self
+
+    def first(self):
+        return self.row
+
+
+class StatusConnection:
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute(self, statement):
+        status = self.statuses[str(statement)]
+        if isinstance(status, Exception):
+            raise status
+        return StatusResult(status)
+
+
+class StatusEngine:
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def connect(self):
+        return StatusConnection(self.statuses)
+
+
+@pytest.mark.asyncio
+async def test_monitor_reads_the_replica_status():
+    engine = StatusEngine({ReplicaMonitor.REPLICA_STATUS: {"Seconds_Behind_Source": 1}})
+    monitor = ReplicaMonitor(engine=engine, max_lag_seconds=5, interval_seconds=1)
+
+    assert await monitor.check() is True
+    assert monitor.lag_seconds == 1
+
+
+@pytest.mark.asyncio
+async def test_monitor_falls_back_to_the_slave_status():
+    engine = StatusEngine(
+        {
+            ReplicaMonitor.REPLICA_STATUS: ProgrammingError(ReplicaMonitor.REPLICA_STATUS, {}, Exception("1064")),
+            ReplicaMonitor.SLAVE_STATUS: {"Seconds_Behind_Master": 10},
+        }
+    )
+    monitor = ReplicaMonitor(engine=engine, max_lag_seconds=5, interval_seconds=1)
+
+    assert await monitor.check() is False
+    assert monitor.lag_seconds == 10
+    assert monitor._status_query == ReplicaMonitor.SLAVE_STATUS
@@ -0,0 +1,47 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import select
+
+from app.db.tasks.import_users import UserImporter, read_rows
+from app.infra.dto.user.user_dto import UserDTO
+from tests.conftest import TEST_USER_EMAIL
+
+CSV = f"""email,phone,password
+import-1@example.com,,a3qf83lSOk
+,0969090659,a3qf83lSOk
+{TEST_USER_EMAIL},,a3qf83lSOk
+not-an-email,,a3qf83lSOk
+"""
+
+
+class PasswordServiceStub:
+    async def hash(self, password) -> str:
+        return "hashed-password"
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_import_inserts_new_users_and_skips_taken_ones(test_create_user, test_session, tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text(CSV)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield test_session
+
+    importer = UserImporter(
+        PasswordServiceStub(), batch_size=10, mark_verified=True, session_factory=session_factory
+    )
+    await importer.run(read_rows(str(path), "csv", skip=0), checkpoint_path=None)
+
+    assert (importer.inserted, importer.skipped, importer.invalid) == (2, 1, 1)
+    emails = (await test_session.execute(select(UserDTO.email).where(UserDTO.email == "import-1@example.com"))).all()
+    assert len(emails) == 1
+    phone_user = (await test_session.execute(select(UserDTO).where(UserDTO.phone == "0969090659"))).scalar_one()
+    assert phone_user.is_phone_verified is True
+    assert phone_user.hashed_password == "hashed-password"
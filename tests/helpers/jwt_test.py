@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from app.config.config import Config
+from app.helpers import jwt
+from app.helpers.jwt import ClaimsCache
+
+
+@pytest.fixture(autouse=True)
+def clear_claims_cache():
+    jwt.claims_cache.clear()
+    yield
+    jwt.claims_cache.clear()
+
+
+def test_decode_jwt_uses_claims_cache():
+    token = jwt.generate_jwt(
+        {"user_id": "1"},
+        Config.JWT_TOKEN_SECRET,
+        Config.JWT_AUD_CREATE,
+        Config.JWT_TOKEN_EXPIRATION_DAY,
+    )
+
+    first = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+    second = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+
+    assert first == second
+    assert first["user_id"] == "1"
+    assert jwt.claims_cache.stats()["misses"] == 1
+    assert jwt.claims_cache.stats()["hits"] == 1
+
+
+def test_decode_jwt_does_not_share_entries_across_secrets():
+    token = jwt.generate_jwt(
+        {"user_id": "1"},
+        Config.JWT_TOKEN_SECRET,
+        Config.JWT_AUD_CREATE,
+        Config.JWT_TOKEN_EXPIRATION_DAY,
+    )
+    jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+
+    with pytest.raises(Exception):
+        jwt.decode_jwt(token, "another-secret")
+
+
+def test_claims_cache_evicts_expired_entries():
+    cache = ClaimsCache(maxsize=10)
+    key = (b"digest", ("aud",), ("HS256",))
+    cache.put(key, {"user_id": "1", "exp": time.time() - 1})
+
+    assert cache.get(key) is None
+    assert cache.stats() == {"size": 0, "maxsize": 10, "hits": 0, "misses": 1}
+
+
+def test_claims_cache_is_bounded():
+    cache = ClaimsCache(maxsize=2)
+    keys = [(bytes([i]), ("aud",), ("HS256",)) for i in range(3)]
+    for key in keys:
+        cache.put(key, {"user_id": "1"})
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == {"user_id": "1"}
+    assert cache.get(keys[2]) == {"user_id": "1"}
@@ -0,0 +1,16 @@
+import pytest
+
+from app.helpers.password_service import PasswordService, PasswordServiceBusy
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_queue_limit_are_rejected():
+    service = PasswordService(max_workers=1, max_queue=0)
+
+    with pytest.raises(PasswordServiceBusy):
+        await service.hash("a3qf83lSOk")
+
+    assert service.stats()["rejected"] == 1
+    assert service.stats()["submitted"] == 0
+    # Rejected calls never start the process pool.
+    assert service._executor is None
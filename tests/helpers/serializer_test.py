@@ -0,0 +1,99 @@
+import datetime
+import enum
+
+import orjson
+from pydantic import BaseModel
+
+from app.helpers.serializer import Serializer
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Item(BaseModel):
+    name: str
+    created_at: datetime.datetime
+
+
+def test_to_jsonable_encodes_nested_values():
+    serializer = Serializer(
+        type_encoders={datetime.datetime: lambda x: x.strftime("%Y-%m-%d")}
+    )
+    created_at = datetime.datetime(2023, 8, 10, 8, 51)
+
+    data = serializer.to_jsonable(
+        {
+            "items": [Item(name="a", created_at=created_at)],
+            "color": Color.RED,
+            "tags": ("x",),
+            "count": 1,
+        }
+    )
+
+    assert data == {
+        "items": [{"name": "a", "created_at": "2023-08-10"}],
+        "color": "red",
+        "tags": ["x"],
+        "count": 1,
+    }
+
+
+def test_to_jsonable_excludes_keys_of_every_dict():
+    serializer = Serializer()
+
+    data = serializer.to_jsonable(
+        {"code": 0, "data": {"token": "secret", "id": 1}}, exclude=["token"]
+    )
+
+    assert data == {"code": 0, "data": {"id": 1}}
+
+
+class Event(BaseModel):
+    name: str
+    created_at: datetime.datetime
+
+    class Config:
+        json_encoders = {datetime.datetime: lambda x: x.strftime("%d/%m/%Y")}
+
+
+def test_to_jsonable_uses_the_json_encoders_of_models():
+    created_at = datetime.datetime(2023, 8, 10, 8, 51)
+
+    data = Serializer().to_jsonable(
+        {"event": Event(name="a", created_at=created_at), "at": created_at}
+    )
+
+    assert data == {
+        "event": {"name": "a", "created_at": "10/08/2023"},
+        "at": "2023-08-10T08:51:00",
+    }
+
+
+def test_type_encoders_take_precedence_over_json_encoders():
+    serializer = Serializer(
+        type_encoders={datetime.datetime: lambda x: x.strftime("%Y-%m-%d")}
+    )
+    created_at = datetime.datetime(2023, 8, 10, 8, 51)
+
+    data = serializer.to_jsonable(Event(name="a", created_at=created_at))
+
+    assert data == {"name": "a", "created_at": "2023-08-10"}
+
+
+def test_encoders_are_cached_per_type():
+    serializer = Serializer()
+    serializer.to_jsonable(Color.RED)
+    encoder = serializer._encoders[Color]
+
+    serializer.to_jsonable([Color.RED])
+
+    assert serializer._encoders[Color] is encoder
+
+
+def test_dumps_returns_orjson_bytes():
+    serializer = Serializer()
+
+    assert serializer.dumps({"msg": "ok", 1: None}) == orjson.dumps(
+        {"msg": "ok", "1": None}
+    )
@@ -0,0 +1,44 @@
+import pytest
+import redis.asyncio
+import redis.exceptions
+
+from app.core.redis.redis import InstrumentedConnectionPool
+
+
+def failing_get_connection(message: str):
+    async def get_connection(self, command_name, *keys, **options):
+        raise redis.exceptions.ConnectionError(message)
+
+    return get_connection
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_exhaustion_as_a_timeout(monkeypatch):
+    monkeypatch.setattr(
+        redis.asyncio.BlockingConnectionPool,
+        "get_connection",
+        failing_get_connection(InstrumentedConnectionPool.POOL_EXHAUSTED_MESSAGE),
+    )
+    pool = InstrumentedConnectionPool(max_connections=1, timeout=0)
+
+    with pytest.raises(redis.exceptions.ConnectionError):
+        await pool.get_connection("GET")
+
+    assert pool.stats()["timeouts"] == 1
+    assert pool.stats()["connection_errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_failed_connects_apart_from_timeouts(monkeypatch):
+    monkeypatch.setattr(
+        redis.asyncio.BlockingConnectionPool,
+        "get_connection",
+        failing_get_connection("Error 111 connecting to localhost:6379. Connection refused."),
+    )
+    pool = InstrumentedConnectionPool(max_connections=1, timeout=0)
+
+    with pytest.raises(redis.exceptions.ConnectionError):
+        await pool.get_connection("GET")
+
+    assert pool.stats()["timeouts"] == 0
+    assert pool.stats()["connection_errors"] == 1
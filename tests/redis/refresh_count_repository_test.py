@@ -0,0 +1,34 @@
+import pytest
+
+from app.core.entities.user.sex_entity import SexEntity
+from app.core.entities.user.user_entity import UserEntity
+from app.core.redis.refresh_count_repository import RefreshCountRepository
+
+LIFETIME_SECONDS = 60 * 60
+
+
+def build_user() -> UserEntity:
+    return UserEntity(id=1, hashed_password="", sex_code=SexEntity.CODE_NOT_KNOWN)
+
+
+@pytest.mark.asyncio
+async def test_increment_count_reports_going_over_the_limit(redis):
+    repository = RefreshCountRepository(redis=redis, lifetime_seconds=LIFETIME_SECONDS)
+    user = build_user()
+
+    assert await repository.increment_count(user, limit=2) == (1, False)
+    assert await repository.increment_count(user, limit=2) == (2, False)
+    assert await repository.increment_count(user, limit=2) == (3, True)
+    assert await repository.read_count(user) == 3
+
+
+@pytest.mark.asyncio
+async def test_increment_count_extends_the_window(redis):
+    repository = RefreshCountRepository(redis=redis, lifetime_seconds=LIFETIME_SECONDS)
+    user = build_user()
+    await repository.increment_count(user, limit=5)
+    await redis.expire("refresh_count:1", 10)
+
+    await repository.increment_count(user, limit=5)
+
+    assert await redis.ttl("refresh_count:1") > LIFETIME_SECONDS - 5
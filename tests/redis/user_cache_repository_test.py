@@ -0,0 +1,69 @@
+import dataclasses
+
+import pytest
+
+from app.core.entities.user.sex_entity import SexEntity
+from app.core.entities.user.user_entity import UserEntity
+from app.core.redis.user_cache_repository import CachedUserRepository
+
+
+class InMemoryUserRepository:
+    def __init__(self, *users: UserEntity):
+        self.users = {user.id: user for user in users}
+        self.updates = []
+
+    async def find_by_id(self, session, id, read_replica=True):
+        user = self.users.get(id)
+        return dataclasses.replace(user) if user else None
+
+    async def update(self, session, user, fields):
+        self.updates.append((user, fields))
+        return user
+
+
+def make_user() -> UserEntity:
+    return UserEntity(
+        id=1,
+        email="journeylingua@gmail.com",
+        hashed_password="hashed",
+        sex_code=SexEntity.CODE_NOT_KNOWN,
+        facebook_access_token="facebook-token",
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_users_carry_no_secrets(redis):
+    repository = CachedUserRepository(InMemoryUserRepository(make_user()), redis=redis)
+    await repository.find_by_id(None, 1)
+
+    user = await repository.find_by_id(None, 1)
+
+    assert "hashed" not in await redis.get("user:1")
+    assert user.hashed_password is None
+    assert user.facebook_access_token is None
+
+
+@pytest.mark.asyncio
+async def test_cached_users_do_not_write_back_redacted_secrets(redis):
+    inner = InMemoryUserRepository(make_user())
+    repository = CachedUserRepository(inner, redis=redis)
+    await repository.find_by_id(None, 1)
+    user = await repository.find_by_id(None, 1)
+
+    with pytest.raises(ValueError):
+        await repository.update(None, user, fields=["name", "hashed_password"])
+    assert inner.updates == []
+
+
+@pytest.mark.asyncio
+async def test_cached_users_accept_new_secret_values(redis):
+    inner = InMemoryUserRepository(make_user())
+    repository = CachedUserRepository(inner, redis=redis)
+    await repository.find_by_id(None, 1)
+    user = await repository.find_by_id(None, 1)
+    user.hashed_password = "new-hash"
+
+    await repository.update(None, user, fields=["hashed_password"])
+
+    assert inner.updates == [(user, ["hashed_password"])]
+    assert await redis.get("user:1") is None
@@ -0,0 +1,118 @@
+import pytest
+
+from app.config.config import Config
+from app.core.redis.user_session_repository import UserSessionRepository
+from app.helpers import jwt
+
+LIFETIME_SECONDS = 60 * 60
+
+
+def generate_token(claims: dict) -> str:
+    return jwt.generate_jwt(
+        claims,
+        Config.JWT_TOKEN_SECRET,
+        Config.JWT_AUD_CREATE,
+        Config.JWT_TOKEN_EXPIRATION_DAY,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_read_and_destroy_session(redis):
+    repository = UserSessionRepository(redis=redis)
+    token = generate_token({"user_id": "1", "jti": "sid-1"})
+    claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+
+    await repository.store_session("sid-1", 1, LIFETIME_SECONDS)
+
+    assert await repository.read_token(token, claims) == 1
+    assert await redis.smembers("user_sessions:1") == {"sid-1"}
+
+    await repository.destroy_token(token, claims)
+
+    assert await repository.read_token(token, claims) is None
+    assert await redis.smembers("user_sessions:1") == set()
+
+
+@pytest.mark.asyncio
+async def test_read_token_falls_back_to_legacy_key(redis):
+    repository = UserSessionRepository(redis=redis)
+    token = generate_token({"user_id": "1"})
+    claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+    await redis.set(f"user_session_token:{token}", "1")
+
+    assert await repository.read_token(token, claims) == 1
+
+    await repository.destroy_token(token, claims)
+
+    assert await redis.get(f"user_session_token:{token}") is None
+    assert await repository.read_token(token, claims) is None
+
+
+@pytest.mark.asyncio
+async def test_read_token_ignores_legacy_key_when_token_has_jti(redis):
+    repository = UserSessionRepository(redis=redis)
+    token = generate_token({"user_id": "1", "jti": "sid-1"})
+    claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+    await redis.set(f"user_session_token:{token}", "1")
+
+    assert await repository.read_token(token, claims) is None
+
+
+@pytest.mark.asyncio
+async def test_store_session_prunes_expired_sessions(redis):
+    repository = UserSessionRepository(redis=redis)
+    await repository.store_session("sid-1", 1, LIFETIME_SECONDS)
+    await repository.store_session("sid-2", 1, LIFETIME_SECONDS)
+    # sid-1 expired, its key is gone but it is still indexed.
+    await redis.delete("user_session:sid-1")
+
+    pruned = await repository.store_session("sid-3", 1, LIFETIME_SECONDS)
+
+    assert pruned == 1
+    assert await redis.smembers("user_sessions:1") == {"sid-2", "sid-3"}
+
+
+@pytest.mark.asyncio
+async def test_store_session_never_shortens_the_index_ttl(redis):
+    repository = UserSessionRepository(redis=redis)
+    await repository.store_session("sid-1", 1, LIFETIME_SECONDS)
+    await repository.store_session("sid-2", 1, 60)
+
+    assert await redis.ttl("user_sessions:1") > 60
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_token(redis):
+    repository = UserSessionRepository(redis=redis)
+    token = generate_token({"user_id": "1"})
+    claims = jwt.decode_jwt(token, Config.JWT_TOKEN_SECRET)
+    await redis.set(f"user_session_token:{token}", "1")
+
+    assert await repository.migrate_legacy_token(token, "1", claims) is True
+    assert await redis.get(f"user_session_token:{token}") is None
+    assert await repository.read_token(token, claims) == 1
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_token_drops_undecodable_tokens(redis):
+    repository = UserSessionRepository(redis=redis)
+    await redis.set("user_session_token:invalid", "1")
+
+    assert await repository.migrate_legacy_token("invalid", "1", None) is False
+    assert await redis.get("user_session_token:invalid") is None
+
+
+@pytest.mark.asyncio
+async def test_destroy_all_tokens_revokes_every_indexed_session(redis):
+    repository = UserSessionRepository(redis=redis)
+    for session_id in ("sid-1", "sid-2", "sid-3"):
+        await repository.store_session(session_id, 1, LIFETIME_SECONDS)
+    await repository.store_session("sid-4", 2, LIFETIME_SECONDS)
+
+    assert await repository.destroy_all_tokens(1) == 3
+
+    for session_id in ("sid-1", "sid-2", "sid-3"):
+        assert await redis.get(f"user_session:{session_id}") is None
+    assert await redis.get("user_sessions:1") is None
+    # Sessions of other users are kept.
+    assert await redis.get("user_session:sid-4") == "2"
@@ -0,0 +1,173 @@
+import time
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.entities.user.sex_entity import SexEntity
+from app.core.entities.user.user_entity import UserEntity
+from app.infra.dto.user.user_dto import UserDTO
+from app.infra.dto.user.user_tombstone_dto import UserTombstoneDTO
+from app.repositories.user.user_repository import UserRepository
+from tests.conftest import TEST_USER_EMAIL, TEST_USER_PHONE
+
+ARCHIVED_USER = {
+    "id": 999999,
+    "user_code": "archived-user",
+    "email": TEST_USER_EMAIL,
+    "phone": TEST_USER_PHONE,
+    "facebook_id": "archived-facebook-id",
+    "google_id": "archived-google-id",
+}
+
+
+async def read_columns(session, user_id: int):
+    stmt = select(UserDTO.name, UserDTO.is_email_verified, UserDTO.updated_at).where(UserDTO.id == user_id)
+    return (await session.execute(stmt)).one()
+
+
+def draw_user_codes(monkeypatch, *codes: str) -> list:
+    drawn = []
+    remaining = iter(codes)
+
+    def generate_user_code_if_empty(self):
+        if not self.user_code:
+            self.user_code = next(remaining)
+            drawn.append(self.user_code)
+
+    monkeypatch.setattr(UserEntity, "generate_user_code_if_empty", generate_user_code_if_empty)
+    return drawn
+
+
+def build_user(**kwargs) -> UserEntity:
+    return UserEntity(hashed_password="hashed-password", sex_code=SexEntity.CODE_NOT_KNOWN, is_active=True, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_create_draws_a_new_user_code_on_collision(test_create_user, test_session, monkeypatch):
+    drawn = draw_user_codes(monkeypatch, test_create_user.user_code, "fresh-user-code")
+
+    created = await UserRepository().create(test_session, build_user(email="collision@example.com"))
+
+    assert drawn == [test_create_user.user_code, "fresh-user-code"]
+    assert created.user_code == "fresh-user-code"
+    assert (await UserRepository().find_by_email(test_session, "collision@example.com")).id == created.id
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_create_reraises_other_integrity_errors(test_create_user, test_session, monkeypatch):
+    drawn = draw_user_codes(monkeypatch, "first-user-code", "second-user-code")
+
+    with pytest.raises(IntegrityError):
+        await UserRepository().create(test_session, build_user(email=TEST_USER_EMAIL))
+
+    assert drawn == ["first-user-code"]
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": False}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_update_writes_only_the_given_fields(test_create_user, test_session):
+    user: UserDTO = test_create_user
+    await test_session.execute(update(UserDTO).where(UserDTO.id == user.id).values(updated_at=0))
+    started = int(time.time())
+    entity = user.to_entity()
+    entity.name = "Not written"
+    entity.is_email_verified = True
+
+    updated = await UserRepository().update(test_session, entity, fields=["is_email_verified"])
+
+    name, is_email_verified, updated_at = await read_columns(test_session, user.id)
+    assert name == user.name
+    assert is_email_verified is True
+    assert updated_at >= started
+    assert updated.updated_at.timestamp() >= started
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": False}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_update_requires_fields(test_create_user, test_session):
+    user: UserDTO = test_create_user
+    entity = user.to_entity()
+    entity.name = "Not written"
+
+    with pytest.raises(ValueError):
+        await UserRepository().update(test_session, entity, fields=[])
+
+    name, _, _ = await read_columns(test_session, user.id)
+    assert name == user.name
+
+
+@pytest.mark.parametrize(
+    "test_create_user",
+    [{"email": TEST_USER_EMAIL, "is_email_verified": True}],
+    indirect=["test_create_user"],
+)
+@pytest.mark.asyncio
+async def test_update_keeps_identities_in_step_with_social_ids(test_create_user, test_session):
+    user: UserDTO = test_create_user
+    repository = UserRepository()
+    entity = user.to_entity()
+
+    entity.facebook_id = "facebook-id-1"
+    await repository.update(test_session, entity, fields=["facebook_id"])
+    assert (await repository.find_by_facebook_id(test_session, "facebook-id-1")).id == user.id
+
+    entity.facebook_id = "facebook-id-2"
+    await repository.update(test_session, entity, fields=["facebook_id"])
+    assert await repository.find_by_facebook_id(test_session, "facebook-id-1") is None
+    assert (await repository.find_by_facebook_id(test_session, "facebook-id-2")).id == user.id
+
+    entity.facebook_id = None
+    await repository.update(test_session, entity, fields=["facebook_id"])
+    assert await repository.find_by_facebook_id(test_session, "facebook-id-2") is None
+
+
+@pytest.mark.parametrize("key", list(ARCHIVED_USER))
+@pytest.mark.asyncio
+async def test_find_tombstone_by_each_lookup_key(test_session, key):
+    test_session.add(UserTombstoneDTO(**ARCHIVED_USER, deleted_at=int(time.time()), archived_at=int(time.time())))
+    await test_session.flush()
+
+    user = await UserRepository().find_tombstone(test_session, key, ARCHIVED_USER[key])
+
+    assert user.id == ARCHIVED_USER["id"]
+    assert user.deleted_at is not None
+    assert user.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_find_by_methods_ignore_archived_users(test_session):
+    test_session.add(UserTombstoneDTO(**ARCHIVED_USER, deleted_at=int(time.time()), archived_at=int(time.time())))
+    await test_session.flush()
+    repository = UserRepository()
+
+    assert await repository.find_by_id(test_session, ARCHIVED_USER["id"]) is None
+    assert await repository.find_by_email(test_session, ARCHIVED_USER["email"]) is None
+    assert await repository.find_by_phone(test_session, ARCHIVED_USER["phone"]) is None
+    assert await repository.find_by_user_code(test_session, ARCHIVED_USER["user_code"]) is None
+    assert await repository.find_by_facebook_id(test_session, ARCHIVED_USER["facebook_id"]) is None
+    assert await repository.find_by_google_id(test_session, ARCHIVED_USER["google_id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_find_tombstone_rejects_unknown_keys(test_session):
+    with pytest.raises(ValueError):
+        await UserRepository().find_tombstone(test_session, "hashed_password", "")
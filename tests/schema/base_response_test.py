@@ -0,0 +1,133 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from app.core.schema.base_response import BaseResponse
+
+Base = declarative_base()
+
+
+class Post(Base):
+    __tablename__ = "posts"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(100))
+    created_at = Column(DateTime)
+
+
+class Comment(Base):
+    __tablename__ = "comments"
+
+    id = Column(Integer, primary_key=True)
+
+
+def test_model_to_list_converts_by_column():
+    created_at = datetime.datetime(2023, 8, 10, 8, 51, 2)
+    posts = [
+        Post(id=1, title="a", created_at=created_at),
+        Post(id=2, title="b", created_at=None),
+    ]
+
+    assert BaseResponse.model_to_list(posts) == [
+        {"id": 1, "title": "a", "created_at": "10-08-2023 08:51:02"},
+        {"id": 2, "title": "b", "created_at": None},
+    ]
+    assert BaseResponse.model_to_list(posts, "title", "created_at") == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+
+def test_model_to_list_matches_model_to_dict_for_mixed_lists():
+    data = [Post(id=1, title="a"), Comment(id=2), {"id": 3}]
+
+    assert BaseResponse.model_to_list(data) == [
+        BaseResponse.model_to_dict(x) for x in data
+    ]
+    assert BaseResponse.model_to_list([]) == []
+
+
+def test_parse_sql_result_matches_json_serialize():
+    data = [
+        {
+            "id": 1,
+            "tags": {"x"},
+            "price": Decimal("1.50"),
+            "raw": b"abc",
+            "at": datetime.datetime(2023, 8, 10, 8, 51, 2),
+        },
+        {"id": 2, "tags": None, "price": None, "raw": None, "at": None},
+    ]
+
+    columns, rows = BaseResponse.parse_sql_result(data)
+
+    assert columns == ["id", "tags", "price", "raw", "at"]
+    assert rows == [BaseResponse.json_serialize(row) for row in data]
+    assert rows[0]["at"] == "10-08-2023 08:51:02"
+
+
+def test_parse_sql_result_checks_values_of_another_type():
+    data = [
+        {"value": Decimal("1.50")},
+        {"value": 2},
+        {"value": b"abc"},
+        {"value": "text"},
+    ]
+
+    _, rows = BaseResponse.parse_sql_result(data)
+
+    assert rows == [BaseResponse.json_serialize(row) for row in data]
+    assert rows == [
+        {"value": "1.50"},
+        {"value": 2},
+        {"value": "abc"},
+        {"value": "text"},
+    ]
+
+
+def test_parse_sql_result_of_no_rows():
+    assert BaseResponse.parse_sql_result([]) == ([], [])
+
+
+async def read_stream(items, exclude=(), chunk_size=64 * 1024):
+    return [
+        chunk
+        async for chunk in BaseResponse._encode_stream(items, 200, "Successfully", tuple(exclude), chunk_size)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_of_no_items_has_an_empty_data_array():
+    chunks = await read_stream([])
+
+    assert json.loads(b"".join(chunks)) == {"code": 200, "msg": "Successfully", "data": []}
+
+
+@pytest.mark.asyncio
+async def test_stream_flushes_once_the_chunk_size_is_buffered():
+    items = [{"id": index, "title": "x" * 10} for index in range(10)]
+
+    chunks = await read_stream(items, chunk_size=32)
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks))["data"] == items
+
+
+@pytest.mark.asyncio
+async def test_stream_consumes_sync_generators():
+    chunks = await read_stream({"id": index} for index in range(3))
+
+    assert json.loads(b"".join(chunks))["data"] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_stream_excludes_keys_from_items():
+    items = [{"id": 1, "secret": "a"}, {"id": 2, "secret": "b"}]
+
+    chunks = await read_stream(items, exclude=["secret"])
+
+    assert json.loads(b"".join(chunks))["data"] == [{"id": 1}, {"id": 2}]